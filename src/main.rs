@@ -2,44 +2,48 @@ use clap::{Parser, Subcommand};
 use log::{info, error, warn};
 use std::path::PathBuf;
 use std::collections::HashSet;
+use std::io::{BufReader, BufWriter, Write};
 use colored::*;
+use futures::StreamExt;
 
 mod youtube;
-use youtube::{YouTubeClient, parse_artists_file};
+use youtube::{Artist, SubscribeError, SubscribeFailure, YouTubeClient, parse_artist_entries};
+
+/// A subscriber count band: counts of at least `min` are shown divided by
+/// `divisor` with `decimals` places, the `unit` suffix and the band's colour.
+struct SubscriberTier {
+    min: u64,
+    divisor: f64,
+    decimals: usize,
+    unit: &'static str,
+    style: fn(&str) -> ColoredString,
+}
+
+/// Subscriber tiers, highest first; counts below the last are shown as-is.
+const SUBSCRIBER_TIERS: [SubscriberTier; 6] = [
+    // 10M+ - Diamond tier
+    SubscriberTier { min: 10_000_000, divisor: 1_000_000.0, decimals: 1, unit: "M", style: |s| s.bright_magenta().bold() },
+    // 1M+ - Platinum tier
+    SubscriberTier { min: 1_000_000, divisor: 1_000_000.0, decimals: 1, unit: "M", style: |s| s.bright_cyan().bold() },
+    // 500K+ - Gold tier
+    SubscriberTier { min: 500_000, divisor: 1_000.0, decimals: 0, unit: "K", style: |s| s.bright_yellow().bold() },
+    // 100K+ - Silver tier
+    SubscriberTier { min: 100_000, divisor: 1_000.0, decimals: 0, unit: "K", style: |s| s.bright_white().bold() },
+    // 10K+ - Bronze tier
+    SubscriberTier { min: 10_000, divisor: 1_000.0, decimals: 0, unit: "K", style: |s| s.yellow() },
+    // 1K+ - Growing
+    SubscriberTier { min: 1_000, divisor: 1_000.0, decimals: 0, unit: "K", style: |s| s.green() },
+];
 
 fn format_subscriber_count(count: u64) -> String {
-    use colored::*;
-    
-    let formatted = if count >= 10_000_000 {
-        // 10M+ - Diamond tier
-        let val = count as f64 / 1_000_000.0;
-        format!("{:.1}M", val).bright_magenta().bold()
-    } else if count >= 1_000_000 {
-        // 1M+ - Platinum tier  
-        let val = count as f64 / 1_000_000.0;
-        format!("{:.1}M", val).bright_cyan().bold()
-    } else if count >= 500_000 {
-        // 500K+ - Gold tier
-        let val = count as f64 / 1_000.0;
-        format!("{:.0}K", val).bright_yellow().bold()
-    } else if count >= 100_000 {
-        // 100K+ - Silver tier
-        let val = count as f64 / 1_000.0;
-        format!("{:.0}K", val).bright_white().bold()
-    } else if count >= 10_000 {
-        // 10K+ - Bronze tier
-        let val = count as f64 / 1_000.0;
-        format!("{:.0}K", val).yellow()
-    } else if count >= 1_000 {
-        // 1K+ - Growing
-        let val = count as f64 / 1_000.0;
-        format!("{:.0}K", val).green()
-    } else {
+    match SUBSCRIBER_TIERS.iter().find(|tier| count >= tier.min) {
+        Some(tier) => {
+            let value = format!("{:.*}{}", tier.decimals, count as f64 / tier.divisor, tier.unit);
+            (tier.style)(&value).to_string()
+        }
         // Sub-1K - Starting out
-        format!("{}", count).bright_black()
-    };
-    
-    formatted.to_string()
+        None => count.to_string().bright_black().to_string(),
+    }
 }
 
 fn truncate_description(desc: &str, verbose: bool) -> String {
@@ -50,6 +54,269 @@ fn truncate_description(desc: &str, verbose: bool) -> String {
     }
 }
 
+/// An artist name borrowed for hashing and comparison ignoring case, so
+/// name sets can be built without allocating a lowercased copy of each name.
+#[derive(Clone, Copy)]
+struct NameKey<'a>(&'a str);
+
+impl NameKey<'_> {
+    fn folded(&self) -> impl Iterator<Item = char> + '_ {
+        self.0.chars().flat_map(char::to_lowercase)
+    }
+}
+
+impl PartialEq for NameKey<'_> {
+    fn eq(&self, other: &Self) -> bool {
+        self.folded().eq(other.folded())
+    }
+}
+
+impl Eq for NameKey<'_> {}
+
+impl std::hash::Hash for NameKey<'_> {
+    fn hash<H: std::hash::Hasher>(&self, state: &mut H) {
+        for c in self.folded() {
+            state.write_u32(c as u32);
+        }
+    }
+}
+
+/// Target artists split by whether a current subscription already matches
+/// them (case-insensitively), each list kept in target order. A target that
+/// repeats an earlier one (ignoring case) appears only once.
+struct SyncPlan<'a> {
+    already_subscribed: Vec<&'a str>,
+    to_subscribe: Vec<&'a str>,
+}
+
+fn plan_sync<'a>(target_artists: &'a [String], current_subscriptions: &[Artist]) -> SyncPlan<'a> {
+    // Hash the current names once so each target is a single O(1) lookup
+    let current_names: HashSet<NameKey> = current_subscriptions
+        .iter()
+        .map(|a| NameKey(&a.name))
+        .collect();
+
+    let mut plan = SyncPlan {
+        already_subscribed: Vec::new(),
+        to_subscribe: Vec::new(),
+    };
+
+    let mut seen_targets = HashSet::with_capacity(target_artists.len());
+
+    for target in target_artists {
+        let key = NameKey(target);
+        if !seen_targets.insert(key) {
+            continue;
+        }
+
+        if current_names.contains(&key) {
+            plan.already_subscribed.push(target);
+        } else {
+            plan.to_subscribe.push(target);
+        }
+    }
+
+    plan
+}
+
+/// Writes the sync plan summary and artist lists to `out`.
+fn write_sync_plan(
+    out: &mut impl Write,
+    plan: &SyncPlan,
+    current_count: usize,
+    target_count: usize,
+    dry_run: bool,
+) -> std::io::Result<()> {
+    writeln!(out, "\n{}", "SYNC PLAN:".bright_cyan().bold())?;
+    writeln!(out, "{}", "==================================================".bright_cyan())?;
+    writeln!(out, "Current subscriptions: {}", current_count.to_string().bright_white().bold())?;
+    writeln!(out, "Target artists: {}", target_count.to_string().bright_white().bold())?;
+    writeln!(out, "Already subscribed: {}", plan.already_subscribed.len().to_string().bright_green().bold())?;
+    writeln!(out, "To subscribe: {}", plan.to_subscribe.len().to_string().bright_yellow().bold())?;
+
+    if !plan.already_subscribed.is_empty() {
+        writeln!(out, "\n{}", "Already SUBSCRIBED to:".bright_green().bold())?;
+        for artist in &plan.already_subscribed {
+            writeln!(out, "  {} {}", "✓".bright_green().bold(), artist.bright_white())?;
+        }
+    }
+
+    if plan.to_subscribe.is_empty() {
+        writeln!(out, "\n{} {}", "✓".bright_green().bold(), "All target artists are already subscribed!".bright_green().bold())?;
+    } else if dry_run {
+        writeln!(out, "\n{}", "DRY RUN - Would SUBSCRIBE to:".bright_yellow().bold())?;
+        for artist in &plan.to_subscribe {
+            writeln!(out, "  {} {}", "+".bright_yellow().bold(), artist.bright_white())?;
+        }
+    }
+
+    Ok(())
+}
+
+/// Outcome counts for the subscribe phase, bumped as each artist is handled
+/// so the closing summary needs no second pass over the results.
+#[derive(Debug, Default)]
+struct SyncStats {
+    subscribed: usize,
+    already_subscribed: usize,
+    not_found: usize,
+    failed: usize,
+}
+
+impl SyncStats {
+    fn processed(&self) -> usize {
+        self.subscribed + self.already_subscribed + self.not_found + self.failed
+    }
+}
+
+/// Where sync records the fingerprint of the target list it last left fully
+/// subscribed, so repeating that sync soon after can skip the API entirely.
+const SYNC_STATE_FILE: &str = "sync_state.txt";
+
+/// How long a recorded sync is trusted before the next one checks YouTube again.
+const SYNC_STATE_MAX_AGE: std::time::Duration = std::time::Duration::from_secs(60 * 60);
+
+/// Fingerprint of a target list that ignores order, case and repeats, like `plan_sync`.
+/// It is written to disk, so it uses FNV-1a over the sorted names rather than
+/// the standard library hasher, whose output may change between releases.
+fn targets_fingerprint(target_artists: &[String]) -> u64 {
+    let mut keys: Vec<String> = target_artists.iter().map(|name| name.to_lowercase()).collect();
+    keys.sort_unstable();
+    keys.dedup();
+
+    keys.join("\n").bytes().fold(0xcbf2_9ce4_8422_2325, |hash, byte| {
+        (hash ^ u64::from(byte)).wrapping_mul(0x0100_0000_01b3)
+    })
+}
+
+/// Whether `path` records a sync of these targets made within `max_age`.
+fn sync_state_matches(path: &std::path::Path, target_artists: &[String], max_age: std::time::Duration) -> bool {
+    let recorded_recently = std::fs::metadata(path)
+        .and_then(|metadata| metadata.modified())
+        .is_ok_and(|modified| modified.elapsed().unwrap_or_default() <= max_age);
+
+    recorded_recently && std::fs::read_to_string(path)
+        .is_ok_and(|state| state.trim() == format!("{:016x}", targets_fingerprint(target_artists)))
+}
+
+/// Records that every one of `target_artists` is now subscribed.
+fn record_sync_state(path: &std::path::Path, target_artists: &[String]) {
+    if let Err(e) = std::fs::write(path, format!("{:016x}\n", targets_fingerprint(target_artists))) {
+        warn!("Could not record sync state in {}: {e}", path.display());
+    }
+}
+
+/// Where `list` saves the subscriptions it shows, for `list --cached` to
+/// print back without contacting YouTube: the listing's source on the first
+/// line, then one JSON object per artist.
+const LAST_LIST_FILE: &str = "last_list.jsonl";
+
+/// Where a listing is written until it completes and replaces `LAST_LIST_FILE`.
+const LAST_LIST_TEMP_FILE: &str = "last_list.jsonl.tmp";
+
+/// How old a saved listing can be and still be used by `list --cached`.
+const LAST_LIST_MAX_AGE: std::time::Duration = std::time::Duration::from_secs(60 * 60);
+
+/// What a listing was built from: the artists file, or config.json.
+fn list_source(artists_file: Option<&std::path::Path>) -> String {
+    artists_file.map_or_else(|| "config.json".to_string(), |path| path.display().to_string())
+}
+
+/// Starts a saved listing with the source it was built from.
+fn save_list_source(out: &mut impl Write, source: &str) -> anyhow::Result<()> {
+    serde_json::to_writer(&mut *out, source)?;
+    out.write_all(b"\n")?;
+    Ok(())
+}
+
+/// Appends `artists` to a saved listing, one JSON object per line.
+fn save_artists(out: &mut impl Write, artists: &[Artist]) -> anyhow::Result<()> {
+    for artist in artists {
+        serde_json::to_writer(&mut *out, artist)?;
+        out.write_all(b"\n")?;
+    }
+    Ok(())
+}
+
+/// The listing saved at `path`, or `None` if there is none, it is older than
+/// `max_age`, it was built from a different `source`, or it is empty or unreadable.
+fn load_last_list(path: &std::path::Path, source: &str, max_age: std::time::Duration) -> anyhow::Result<Option<Vec<Artist>>> {
+    let file = match std::fs::File::open(path) {
+        Ok(file) => file,
+        Err(e) if e.kind() == std::io::ErrorKind::NotFound => return Ok(None),
+        Err(e) => return Err(e.into()),
+    };
+
+    let age = file.metadata()?.modified()?.elapsed().unwrap_or_default();
+    if age > max_age {
+        return Ok(None);
+    }
+
+    let mut lines = serde_json::Deserializer::from_reader(BufReader::new(file)).into_iter::<serde_json::Value>();
+    match lines.next() {
+        Some(Ok(serde_json::Value::String(saved_source))) if saved_source == source => {}
+        _ => return Ok(None),
+    }
+    let artists = match lines
+        .map(|line| line.and_then(serde_json::from_value::<Artist>))
+        .collect::<Result<Vec<_>, _>>()
+    {
+        Ok(artists) => artists,
+        Err(e) => {
+            warn!("Ignoring unreadable {}: {e}", path.display());
+            return Ok(None);
+        }
+    };
+    Ok((!artists.is_empty()).then_some(artists))
+}
+
+/// Writes one numbered line per artist, numbering from `first_number`.
+fn write_artist_page(out: &mut impl Write, artists: &[Artist], first_number: usize, verbose: bool) -> std::io::Result<()> {
+    for (i, artist) in artists.iter().enumerate() {
+        let info = match (&artist.description, artist.subscriber_count) {
+            (Some(desc), Some(count)) => {
+                let truncated_desc = truncate_description(desc, verbose);
+                format!("({truncated_desc} - {subs} subs)", subs = format_subscriber_count(count))
+            },
+            (Some(desc), None) => {
+                let truncated_desc = truncate_description(desc, verbose);
+                format!("({truncated_desc})")
+            },
+            (None, Some(count)) => format!("({subs} subs)", subs = format_subscriber_count(count)),
+            (None, None) => String::new(),
+        };
+        let number = format!("{}.", first_number + i).bright_cyan().bold();
+        let name = artist.name.bright_white();
+        let info_styled = info.bright_black();
+        writeln!(out, "{number} {name} {info_styled}")?;
+    }
+    Ok(())
+}
+
+/// Writes artist names to `output_file`, one per line.
+fn save_names<'a>(output_file: &std::path::Path, names: impl IntoIterator<Item = &'a str>) -> anyhow::Result<()> {
+    // Stream names straight to the file instead of building a joined copy
+    let mut writer = BufWriter::new(std::fs::File::create(output_file)?);
+    for (i, name) in names.into_iter().enumerate() {
+        if i > 0 {
+            writer.write_all(b"\n")?;
+        }
+        writer.write_all(name.as_bytes())?;
+    }
+    writer.flush()?;
+    println!("{} {}", "Subscriptions saved to:".bright_green(), output_file.display().to_string().bright_white().bold());
+    Ok(())
+}
+
+/// Parses `--delay`, which must be a number of seconds a `Duration` can hold:
+/// not negative, NaN, infinite or out of range.
+fn parse_delay(value: &str) -> Result<f64, String> {
+    let seconds: f64 = value.parse().map_err(|e| format!("{e}"))?;
+    std::time::Duration::try_from_secs_f64(seconds)
+        .map(|_| seconds)
+        .map_err(|_| format!("{value} is not a valid number of seconds"))
+}
+
 #[derive(Parser)]
 #[command(name = "ytmusic-manager")]
 #[command(version = "0.1.0")]
@@ -85,12 +352,24 @@ enum Commands {
         no_dry_run: bool,
 
         /// Delay between actions in seconds
-        #[arg(long, default_value_t = 2.0)]
+        #[arg(long, default_value_t = 2.0, value_parser = parse_delay)]
         delay: f64,
 
         /// Ask for confirmation before making changes
         #[arg(long)]
         interactive: bool,
+
+        /// Search for every artist instead of using channels cached by earlier runs
+        #[arg(long)]
+        no_cache: bool,
+
+        /// Check YouTube even if the last sync of the same list finished within the hour
+        #[arg(long)]
+        recheck: bool,
+
+        /// Artist searches to run at once (default: settings.search_concurrency)
+        #[arg(long, value_parser = clap::builder::RangedU64ValueParser::<usize>::new().range(1..))]
+        parallel: Option<usize>,
     },
     /// List current subscriptions
     List {
@@ -105,6 +384,10 @@ enum Commands {
         /// Update artist info from API (ignores cache)
         #[arg(long)]
         update_artist_info: bool,
+
+        /// Show the list saved by the last run if under an hour old, without contacting YouTube
+        #[arg(long, conflicts_with = "update_artist_info")]
+        cached: bool,
     },
     /// Validate artists file format
     Validate {
@@ -123,11 +406,8 @@ enum Commands {
     },
 }
 
-#[tokio::main]
+#[tokio::main(flavor = "current_thread")]
 async fn main() -> anyhow::Result<()> {
-    // Initialize crypto provider for rustls
-    let _ = rustls::crypto::ring::default_provider().install_default();
-    
     let cli = Cli::parse();
 
     // Setup logging
@@ -152,24 +432,27 @@ async fn main() -> anyhow::Result<()> {
             dry_run,
             no_dry_run,
             delay,
-            interactive,
+            interactive: _,
+            no_cache,
+            recheck,
+            parallel,
         } => {
             let actual_dry_run = if no_dry_run { false } else { dry_run };
-            cmd_sync(
-                artists_file.as_deref(),
-                actual_dry_run,
+            cmd_sync(SyncOptions {
+                artists_file: artists_file.as_deref(),
+                dry_run: actual_dry_run,
                 delay,
-                interactive,
-                !cli.show_browser,
-                cli.verbose,
-            )
+                parallel,
+                use_cache: !no_cache,
+                use_sync_state: !recheck,
+            })
             .await
         }
-        Commands::List { output, artists_file, update_artist_info } => {
-            cmd_list(output.as_deref(), artists_file.as_deref(), update_artist_info, !cli.show_browser, cli.verbose).await
+        Commands::List { output, artists_file, update_artist_info, cached } => {
+            cmd_list(output.as_deref(), artists_file.as_deref(), update_artist_info, cached, !cli.show_browser, cli.verbose).await
         }
         Commands::Validate { artists_file } => {
-            cmd_validate(&artists_file, cli.verbose).await
+            cmd_validate(&artists_file, cli.verbose)
         }
         Commands::Goto { number, artists_file } => {
             cmd_goto(number, artists_file.as_deref(), cli.verbose).await
@@ -188,14 +471,22 @@ async fn main() -> anyhow::Result<()> {
     }
 }
 
-async fn cmd_sync(
-    artists_file: Option<&std::path::Path>,
+/// How `cmd_sync` runs, as chosen on the `sync` command line.
+struct SyncOptions<'a> {
+    artists_file: Option<&'a std::path::Path>,
     dry_run: bool,
+    /// Seconds between artist search starts
     delay: f64,
-    _interactive: bool,
-    _headless: bool, // Not needed for API
-    _verbose: bool,
-) -> anyhow::Result<()> {
+    /// Artist searches at once; `None` uses `settings.search_concurrency`
+    parallel: Option<usize>,
+    /// Reuse channels cached by earlier runs instead of searching again
+    use_cache: bool,
+    /// Skip the sync when `SYNC_STATE_FILE` shows these targets were just subscribed
+    use_sync_state: bool,
+}
+
+async fn cmd_sync(options: SyncOptions<'_>) -> anyhow::Result<()> {
+    let SyncOptions { artists_file, dry_run, delay, parallel, use_cache, use_sync_state } = options;
     let source = if let Some(file) = artists_file {
         format!("file: {}", file.display())
     } else {
@@ -209,129 +500,287 @@ async fn cmd_sync(
         delay
     );
 
+    // Read the artists file before authenticating, so a missing or empty
+    // file never pays for the OAuth flow
+    let file_artists = match artists_file {
+        Some(file_path) => {
+            let parsed_artists = youtube::load_artists_file(file_path)?;
+            info!("Loaded {} target artists from {}", parsed_artists.len(), file_path.display());
+            Some(parsed_artists)
+        }
+        None => None,
+    };
+    if file_artists.as_ref().is_some_and(Vec::is_empty) {
+        println!("{}", "No target artists to sync.".bright_yellow());
+        return Ok(());
+    }
+
+    let sync_state = std::path::Path::new(SYNC_STATE_FILE);
+    let unchanged = |target_artists: &[String]| {
+        use_sync_state && sync_state_matches(sync_state, target_artists, SYNC_STATE_MAX_AGE)
+    };
+    if file_artists.as_deref().is_some_and(unchanged) {
+        println!("{}", "All target artists were subscribed by the last sync; nothing to do.".bright_green());
+        return Ok(());
+    }
+
     // Initialize YouTube client and get target artists
     let client = YouTubeClient::new().await?;
-    let target_artists = if let Some(file_path) = artists_file {
-        if !file_path.exists() {
-            anyhow::bail!("Artists file not found: {}", file_path.display());
+    let target_artists = match file_artists {
+        Some(parsed_artists) => parsed_artists,
+        None => {
+            // Use config artists
+            let config_artists = client.get_config_artists().clone();
+            info!("Loaded {} target artists from config.json", config_artists.len());
+            config_artists
         }
-        
-        // Parse artists file
-        let content = std::fs::read_to_string(file_path)?;
-        let parsed_artists = parse_artists_file(&content)?;
-        info!("Loaded {} target artists from {}", parsed_artists.len(), file_path.display());
-        parsed_artists
-    } else {
-        // Use config artists
-        let config_artists = client.get_config_artists().clone();
-        info!("Loaded {} target artists from config.json", config_artists.len());
-        config_artists
     };
-
-    // Client already initialized above
+    if target_artists.is_empty() {
+        println!("{}", "No target artists to sync.".bright_yellow());
+        return Ok(());
+    }
+    if artists_file.is_none() && unchanged(&target_artists) {
+        println!("{}", "All target artists were subscribed by the last sync; nothing to do.".bright_green());
+        return Ok(());
+    }
     
     // Get current subscriptions
-    let current_subscriptions = client.get_my_subscriptions().await?;
-    let current_names: HashSet<String> = current_subscriptions
-        .iter()
-        .map(|a| a.name.to_lowercase())
-        .collect();
+    // Only a list read from the account itself can show the targets are all
+    // subscribed; the fallback is built from the targets and would always agree
+    let (current_subscriptions, listed_from_account) = client.get_my_subscriptions().await?;
 
     // Find artists to subscribe to
-    let mut to_subscribe = Vec::new();
-    let mut already_subscribed = Vec::new();
-    
-    for target in &target_artists {
-        if current_names.contains(&target.to_lowercase()) {
-            already_subscribed.push(target.clone());
-        } else {
-            to_subscribe.push(target.clone());
+    let plan = plan_sync(&target_artists, &current_subscriptions);
+
+    // Display sync plan, buffered so it reaches the terminal in one write
+    let mut out = BufWriter::new(std::io::stdout().lock());
+    write_sync_plan(&mut out, &plan, current_subscriptions.len(), target_artists.len(), dry_run)?;
+    out.flush()?;
+    drop(out);
+
+    if plan.to_subscribe.is_empty() {
+        if listed_from_account {
+            record_sync_state(sync_state, &target_artists);
+        }
+    } else if !dry_run {
+        let mut stats = SyncStats::default();
+        let concurrency = parallel.unwrap_or_else(|| client.search_concurrency());
+        let resolved = resolve_artists(&client, &plan.to_subscribe, delay, concurrency, use_cache, &mut stats).await;
+        // A found channel can already be subscribed under a different title
+        // (e.g. its "- Topic" channel), so also check by channel ID
+        let subscribed_ids: HashSet<&str> = current_subscriptions.iter()
+            .map(|artist| artist.channel_id.as_str())
+            .collect();
+        subscribe_resolved(&client, &resolved, &subscribed_ids, &mut stats).await;
+
+        println!("\n{}", "SYNC SUMMARY:".bright_cyan().bold());
+        println!("Processed: {}", stats.processed().to_string().bright_white().bold());
+        println!("Subscribed: {}", stats.subscribed.to_string().bright_green().bold());
+        println!("Already subscribed: {}", stats.already_subscribed.to_string().bright_green().bold());
+        println!("Not found: {}", stats.not_found.to_string().bright_yellow().bold());
+        println!("Failed: {}", stats.failed.to_string().bright_red().bold());
+
+        if listed_from_account && stats.not_found == 0 && stats.failed == 0 {
+            record_sync_state(sync_state, &target_artists);
         }
     }
 
-    // Display sync plan
-    println!("\n{}", "SYNC PLAN:".bright_cyan().bold());
-    println!("{}", "==================================================".bright_cyan());
-    println!("Current subscriptions: {}", current_subscriptions.len().to_string().bright_white().bold());
-    println!("Target artists: {}", target_artists.len().to_string().bright_white().bold());
-    println!("Already subscribed: {}", already_subscribed.len().to_string().bright_green().bold());
-    println!("To subscribe: {}", to_subscribe.len().to_string().bright_yellow().bold());
+    Ok(())
+}
+
+/// Phase one of a sync: searches for each artist to find its channel and
+/// returns those that were found, in input order. Search starts are spaced
+/// `delay` seconds apart, with up to `concurrency` in flight, so slow
+/// responses overlap instead of queueing behind each other. With `use_cache`,
+/// artists cached by earlier runs are answered without a search or a wait.
+async fn resolve_artists<'a>(
+    client: &YouTubeClient,
+    artist_names: &[&'a str],
+    delay: f64,
+    concurrency: usize,
+    use_cache: bool,
+    stats: &mut SyncStats,
+) -> Vec<(&'a str, Artist)> {
+    println!("\n{} {} {}", "SEARCHING for".bright_blue().bold(), artist_names.len().to_string().bright_white().bold(), "artists:".bright_blue().bold());
+
+    let pace = std::time::Duration::from_secs_f64(delay);
+    let start = tokio::time::Instant::now();
+    // Only real searches take a pacing slot
+    let mut slots = 0u32..;
+    let searches = artist_names.iter().map(|&artist_name| {
+        let cached = if use_cache { client.cached_artist(artist_name) } else { None };
+        let slot = if cached.is_none() { slots.next() } else { None };
+        async move {
+            if let Some(slot) = slot {
+                tokio::time::sleep_until(start + pace * slot).await;
+                return (artist_name, client.search_artist(artist_name).await);
+            }
+            (artist_name, Ok(cached))
+        }
+    });
+    // buffered() keeps results in input order while running searches concurrently
+    let mut results = futures::stream::iter(searches).buffered(concurrency.max(1));
 
-    if !already_subscribed.is_empty() {
-        println!("\n{}", "Already SUBSCRIBED to:".bright_green().bold());
-        for artist in &already_subscribed {
-            println!("  {} {}", "✓".bright_green().bold(), artist.bright_white());
+    let mut resolved = Vec::with_capacity(artist_names.len());
+    let mut done = 0;
+    while let Some((artist_name, result)) = results.next().await {
+        done += 1;
+        println!("  {} {}", format!("[{done}/{total}]", total = artist_names.len()).bright_black(), artist_name.bright_white().bold());
+
+        match result {
+            Ok(Some(artist)) => {
+                println!("    {} {} {}", "Found:".bright_green(), artist.name.bright_white().bold(), format!("({channel_id})", channel_id = artist.channel_id).bright_black());
+                resolved.push((artist_name, artist));
+            }
+            Ok(None) => {
+                stats.not_found += 1;
+                warn!("Could not find artist: {artist_name}");
+                println!("    {} {}", "✗".bright_red().bold(), "Artist not found".bright_red());
+            }
+            Err(e) => {
+                stats.failed += 1;
+                warn!("Search failed for {artist_name}: {e}");
+                println!("    {} {}: {error}", "✗".bright_red().bold(), "Search error".bright_red(), error = e.to_string().red());
+            }
         }
     }
 
-    if !to_subscribe.is_empty() {
-        if dry_run {
-            println!("\n{}", "DRY RUN - Would SUBSCRIBE to:".bright_yellow().bold());
-            for artist in &to_subscribe {
-                println!("  {} {}", "+".bright_yellow().bold(), artist.bright_white());
+    resolved
+}
+
+/// Phase two of a sync: subscribes to every resolved channel, one request per
+/// channel (all the subscriptions API takes), with up to
+/// `client.subscribe_concurrency()` in flight. Pacing is left to the client,
+/// whose token bucket (`settings.subscribe_rate_per_minute`) spaces every
+/// attempt, retries included, so no delay is added here. Channels in
+/// `subscribed_ids`, and repeats of a channel another name already resolved
+/// to, are counted as already subscribed without a request.
+async fn subscribe_resolved(
+    client: &YouTubeClient,
+    resolved: &[(&str, Artist)],
+    subscribed_ids: &HashSet<&str>,
+    stats: &mut SyncStats,
+) {
+    if resolved.is_empty() {
+        return;
+    }
+
+    println!("\n{} {} {}", "SUBSCRIBING to".bright_blue().bold(), resolved.len().to_string().bright_white().bold(), "artists:".bright_blue().bold());
+
+    let mut requested = HashSet::with_capacity(resolved.len());
+    let requests = resolved.iter().map(|(artist_name, artist)| {
+        let channel_id = artist.channel_id.as_str();
+        let needed = !subscribed_ids.contains(channel_id) && requested.insert(channel_id);
+        async move {
+            let result = if needed {
+                Some(client.subscribe_to_channel(channel_id).await)
+            } else {
+                None
+            };
+            (artist_name, artist, result)
+        }
+    });
+    let mut results = futures::stream::iter(requests).buffered(client.subscribe_concurrency());
+
+    let mut done = 0;
+    while let Some((artist_name, artist, result)) = results.next().await {
+        done += 1;
+        println!("  {} {}", format!("[{done}/{total}]", total = resolved.len()).bright_black(), artist.name.bright_white().bold());
+
+        let Some(result) = result else {
+            stats.already_subscribed += 1;
+            println!("    {} {}", "✓".bright_green().bold(), "Already subscribed".bright_green());
+            continue;
+        };
+
+        match result {
+            Ok(()) => {
+                stats.subscribed += 1;
+                println!("    {} {}", "✓".bright_green().bold(), "Successfully subscribed".bright_green());
             }
-        } else {
-            println!("\n{} {} {}", "SUBSCRIBING to".bright_blue().bold(), to_subscribe.len().to_string().bright_white().bold(), "artists:".bright_blue().bold());
-            
-            for (i, artist_name) in to_subscribe.iter().enumerate() {
-                println!("  {} {} {}", format!("[{current}/{total}]", current = i + 1, total = to_subscribe.len()).bright_black(), "Searching for:".bright_black(), artist_name.bright_white().bold());
-                
-                match client.search_artist(artist_name).await {
-                    Ok(Some(artist)) => {
-                        println!("    {} {} {}", "Found:".bright_green(), artist.name.bright_white().bold(), format!("({channel_id})", channel_id = artist.channel_id).bright_black());
-                        
-                        match client.subscribe_to_channel(&artist.channel_id).await {
-                            Ok(()) => println!("    {} {}", "✓".bright_green().bold(), "Successfully subscribed".bright_green()),
-                            Err(e) => {
-                                warn!("Failed to subscribe to {artist_name}: {e}");
-                                let error_str = e.to_string();
-                                if error_str.contains("quota") {
-                                    println!("    {} {}: {error}", "⚠".bright_yellow().bold(), "API quota exceeded".bright_yellow(), error = "Consider increasing quota or trying later".yellow());
-                                } else if error_str.contains("Permission denied") {
-                                    println!("    {} {}: {error}", "⚠".bright_yellow().bold(), "Permission issue".bright_yellow(), error = "Check OAuth settings".yellow());
-                                } else if error_str.contains("already subscribed") {
-                                    println!("    {} {}", "✓".bright_green().bold(), "Already subscribed".bright_green());
-                                } else {
-                                    println!("    {} {}: {error}", "✗".bright_red().bold(), "Failed to subscribe".bright_red(), error = error_str.red());
-                                }
-                            }
-                        }
+            Err(e) => {
+                warn!("Failed to subscribe to {artist_name}: {e}");
+                match e.downcast_ref::<SubscribeError>().map(|e| e.kind) {
+                    Some(SubscribeFailure::Duplicate) => {
+                        stats.already_subscribed += 1;
+                        println!("    {} {}", "✓".bright_green().bold(), "Already subscribed".bright_green());
                     }
-                    Ok(None) => {
-                        warn!("Could not find artist: {artist_name}");
-                        println!("    {} {}", "✗".bright_red().bold(), "Artist not found".bright_red());
+                    Some(SubscribeFailure::RateLimited) => {
+                        stats.failed += 1;
+                        println!("    {} {}: {error}", "⚠".bright_yellow().bold(), "API quota exceeded".bright_yellow(), error = "Consider increasing quota or trying later".yellow());
                     }
-                    Err(e) => {
-                        warn!("Search failed for {artist_name}: {e}");
-                        println!("    {} {}: {error}", "✗".bright_red().bold(), "Search error".bright_red(), error = e.to_string().red());
+                    Some(SubscribeFailure::PermissionDenied) => {
+                        stats.failed += 1;
+                        println!("    {} {}: {error}", "⚠".bright_yellow().bold(), "Permission issue".bright_yellow(), error = "Check OAuth settings".yellow());
+                    }
+                    _ => {
+                        stats.failed += 1;
+                        println!("    {} {}: {error}", "✗".bright_red().bold(), "Failed to subscribe".bright_red(), error = e.to_string().red());
                     }
-                }
-                
-                if i < to_subscribe.len() - 1 {
-                    tokio::time::sleep(std::time::Duration::from_secs_f64(delay)).await;
                 }
             }
         }
-    } else {
-        println!("\n{} {}", "✓".bright_green().bold(), "All target artists are already subscribed!".bright_green().bold());
     }
-
-    Ok(())
 }
 
 async fn cmd_list(
     output: Option<&std::path::Path>,
     artists_file: Option<&std::path::Path>,
     update_artist_info: bool,
+    cached: bool,
     _headless: bool, // Not needed for API
     _verbose: bool,
 ) -> anyhow::Result<()> {
     info!("Listing current subscriptions");
 
+    if cached {
+        match load_last_list(std::path::Path::new(LAST_LIST_FILE), &list_source(artists_file), LAST_LIST_MAX_AGE)? {
+            Some(artists) => {
+                info!("Using {} subscriptions saved in {LAST_LIST_FILE}", artists.len());
+                let mut out = BufWriter::new(std::io::stdout().lock());
+                writeln!(out)?;
+                write_artist_page(&mut out, &artists, 1, _verbose)?;
+                writeln!(out, "\n{found} {text}",
+                         found = artists.len().to_string().bright_white().bold(),
+                         text = "Subscriptions shown (cached)".bright_green())?;
+                out.flush()?;
+                drop(out);
+
+                if let Some(output_file) = output {
+                    save_names(output_file, artists.iter().map(|artist| artist.name.as_str()))?;
+                }
+                return Ok(());
+            }
+            None => println!("{}", "No recent saved list, fetching from YouTube...".bright_yellow()),
+        }
+    }
+
     let client = YouTubeClient::new().await?;
+    // Saved as pages are shown, to a temporary file that only replaces the
+    // last listing once this one completes; failing to save never stops the listing
+    let mut snapshot = match std::fs::File::create(LAST_LIST_TEMP_FILE) {
+        Ok(file) => {
+            let mut writer = BufWriter::new(file);
+            match save_list_source(&mut writer, &list_source(artists_file)) {
+                Ok(()) => Some(writer),
+                Err(e) => {
+                    warn!("Could not save listing to {LAST_LIST_FILE}: {e}");
+                    None
+                }
+            }
+        }
+        Err(e) => {
+            warn!("Could not save listing to {LAST_LIST_FILE}: {e}");
+            None
+        }
+    };
+    // Set once every page has been fetched from real data
+    let mut complete = false;
     let mut offset = 0;
     let limit = 50; // Show more at once with higher quotas
-    let mut all_subscriptions = Vec::new();
+    // Only names are needed once a page is printed, and only for --output
+    let mut saved_names = Vec::new();
+    let mut shown = 0;
     let mut total_channels = 0;
     
     loop {
@@ -347,34 +796,34 @@ async fn cmd_list(
             break;
         }
         
-        // Display current batch
+        // Display current batch, buffered so the page is written in one go
+        let mut out = BufWriter::new(std::io::stdout().lock());
         if offset == 0 {
-            println!();
+            writeln!(out)?;
         }
         
-        for (i, artist) in subscriptions.iter().enumerate() {
-            let global_index = offset + i + 1;
-            let info = match (&artist.description, artist.subscriber_count) {
-                (Some(desc), Some(count)) => {
-                    let truncated_desc = truncate_description(desc, _verbose);
-                    format!("({truncated_desc} - {subs} subs)", subs = format_subscriber_count(count))
-                },
-                (Some(desc), None) => {
-                    let truncated_desc = truncate_description(desc, _verbose);
-                    format!("({truncated_desc})")
-                },
-                (None, Some(count)) => format!("({subs} subs)", subs = format_subscriber_count(count)),
-                (None, None) => String::new(),
-            };
-            let number = format!("{}.", global_index).bright_cyan().bold();
-            let name = artist.name.bright_white();
-            let info_styled = info.bright_black();
-            println!("{number} {name} {info_styled}");
+        write_artist_page(&mut out, &subscriptions, offset + 1, _verbose)?;
+        out.flush()?;
+        drop(out);
+
+        // Placeholder data is shown but never saved as a real listing
+        if subscriptions.iter().any(Artist::is_mock) {
+            snapshot = None;
+        }
+        if let Some(writer) = &mut snapshot {
+            if let Err(e) = save_artists(writer, &subscriptions) {
+                warn!("Could not save listing to {LAST_LIST_FILE}: {e}");
+                snapshot = None;
+            }
         }
         
-        all_subscriptions.extend(subscriptions);
+        shown += subscriptions.len();
+        if output.is_some() {
+            saved_names.extend(subscriptions.into_iter().map(|artist| artist.name));
+        }
         
         if !has_more {
+            complete = true;
             break;
         }
         
@@ -399,46 +848,56 @@ async fn cmd_list(
     }
     
     println!("\n{found}/{total} {text}", 
-             found = all_subscriptions.len().to_string().bright_white().bold(),
+             found = shown.to_string().bright_white().bold(),
              total = total_channels.to_string().bright_white().bold(),
              text = "Subscriptions shown".bright_green());
     
+    match snapshot.filter(|_| complete) {
+        Some(writer) => {
+            let saved = writer.into_inner().map_err(|e| e.into_error())
+                .and_then(|file| {
+                    drop(file);
+                    std::fs::rename(LAST_LIST_TEMP_FILE, LAST_LIST_FILE)
+                });
+            if let Err(e) = saved {
+                warn!("Could not save listing to {LAST_LIST_FILE}: {e}");
+            }
+        }
+        // A partial listing is dropped, leaving the last complete one in place
+        None => {
+            std::fs::remove_file(LAST_LIST_TEMP_FILE).ok();
+        }
+    }
+
     if let Some(output_file) = output {
-        let content = all_subscriptions.iter()
-            .map(|a| a.name.clone())
-            .collect::<Vec<_>>()
-            .join("\n");
-        std::fs::write(output_file, content)?;
-        println!("{} {}", "Subscriptions saved to:".bright_green(), output_file.display().to_string().bright_white().bold());
+        save_names(output_file, saved_names.iter().map(String::as_str))?;
     }
 
     Ok(())
 }
 
-async fn cmd_validate(artists_file: &PathBuf, verbose: bool) -> anyhow::Result<()> {
+fn cmd_validate(artists_file: &std::path::Path, verbose: bool) -> anyhow::Result<()> {
     info!("Validating artists file: {}", artists_file.display());
 
-    if !artists_file.exists() {
-        anyhow::bail!("File not found: {}", artists_file.display());
-    }
-
-    let content = std::fs::read_to_string(artists_file)?;
+    // One read for the whole file; a missing file shows up as NotFound here
+    // rather than through a separate exists() check first
+    let content = match std::fs::read_to_string(artists_file) {
+        Ok(content) => content,
+        Err(e) if e.kind() == std::io::ErrorKind::NotFound => {
+            anyhow::bail!("File not found: {}", artists_file.display())
+        }
+        Err(e) => return Err(e.into()),
+    };
     
     // Use the parsing function to validate
-    match parse_artists_file(&content) {
+    match parse_artist_entries(&content) {
         Ok(artists) => {
             if verbose {
-                for (line_num, line) in content.lines().enumerate() {
-                    let line = line.trim();
-                    if line.is_empty() || line.starts_with('#') {
-                        continue;
-                    }
-
-                    // Parse tags if present
-                    if let Some((name, tags)) = line.split_once('|') {
-                        println!("{} {}: {} {}", "VALID Line".bright_green(), (line_num + 1).to_string().bright_white().bold(), name.trim().bright_white().bold(), format!("(tags: {tags})", tags = tags.trim()).bright_black());
-                    } else {
-                        println!("{} {}: {}", "VALID Line".bright_green(), (line_num + 1).to_string().bright_white().bold(), line.bright_white().bold());
+                for entry in &artists {
+                    let line_num = entry.line_num.to_string();
+                    match entry.tags {
+                        Some(tags) => println!("{} {}: {} {}", "VALID Line".bright_green(), line_num.bright_white().bold(), entry.name.bright_white().bold(), format!("(tags: {tags})").bright_black()),
+                        None => println!("{} {}: {}", "VALID Line".bright_green(), line_num.bright_white().bold(), entry.name.bright_white().bold()),
                     }
                 }
             }
@@ -469,14 +928,26 @@ async fn cmd_goto(
 
     let client = YouTubeClient::new().await?;
     
-    // Get all subscriptions to find the one at the requested index
-    let (all_subscriptions, _, total_count) = client.get_subscriptions_with_pagination(0, 1000, artists_file, false, _verbose).await?;
-    
-    if number > total_count {
-        anyhow::bail!("Invalid subscription number. Available subscriptions: 1-{total_count}");
+    // Page through the subscriptions only until the requested one is
+    // resolved, instead of resolving every channel up front
+    let page_size = 50;
+    let mut subscriptions = Vec::new();
+    let mut offset = 0;
+    loop {
+        let (page, has_more, total_count) = client.get_subscriptions_with_pagination(offset, page_size, artists_file, false, _verbose).await?;
+        
+        if number > total_count {
+            anyhow::bail!("Invalid subscription number. Available subscriptions: 1-{total_count}");
+        }
+        
+        subscriptions.extend(page);
+        if subscriptions.len() >= number || !has_more {
+            break;
+        }
+        offset += page_size;
     }
     
-    if let Some(artist) = all_subscriptions.get(number - 1) {
+    if let Some(artist) = subscriptions.get(number - 1) {
         let youtube_music_url = format!("https://music.youtube.com/channel/{}", artist.channel_id);
         
         let opening = "Opening".bright_green();
@@ -500,6 +971,11 @@ async fn cmd_goto(
 mod tests {
     use super::*;
 
+    /// A current subscription with only the fields plan_sync reads.
+    fn artist(name: &str, channel_id: &str) -> Artist {
+        Artist { name: name.to_string(), channel_id: channel_id.to_string(), subscriber_count: None, description: None }
+    }
+
     #[test]
     fn test_truncate_description_short_text() {
         let short_desc = "This is a short description";
@@ -550,6 +1026,182 @@ mod tests {
         assert_eq!(truncate_description(&desc_121, true), desc_121);
     }
 
+    #[test]
+    fn test_cli_parses_each_subcommand() {
+        let cases: &[(&[&str], &str)] = &[
+            (&["ytmusic-manager", "sync"], "sync"),
+            (&["ytmusic-manager", "sync", "--no-dry-run", "--delay", "0.5"], "sync"),
+            (&["ytmusic-manager", "sync", "--parallel", "8", "--no-cache"], "sync"),
+            (&["ytmusic-manager", "sync", "--recheck"], "sync"),
+            (&["ytmusic-manager", "list", "-o", "subs.txt"], "list"),
+            (&["ytmusic-manager", "list", "--cached"], "list"),
+            (&["ytmusic-manager", "validate", "-v"], "validate"),
+            (&["ytmusic-manager", "goto", "3"], "goto"),
+        ];
+
+        for &(args, expected) in cases {
+            let cli = Cli::try_parse_from(args).unwrap_or_else(|e| panic!("{args:?}: {e}"));
+            let name = match cli.command {
+                Commands::Sync { .. } => "sync",
+                Commands::List { .. } => "list",
+                Commands::Validate { .. } => "validate",
+                Commands::Goto { .. } => "goto",
+            };
+            assert_eq!(name, expected, "{args:?}");
+        }
+
+        assert!(Cli::try_parse_from(["ytmusic-manager", "goto"]).is_err());
+        assert!(Cli::try_parse_from(["ytmusic-manager", "sync", "--parallel", "0"]).is_err());
+        for delay in ["-1", "NaN", "inf", "1e30", "soon"] {
+            let arg = format!("--delay={delay}");
+            assert!(Cli::try_parse_from(["ytmusic-manager", "sync", arg.as_str()]).is_err(), "{arg}");
+        }
+        assert!(Cli::try_parse_from(["ytmusic-manager", "list", "--cached", "--update-artist-info"]).is_err());
+    }
+
+    #[test]
+    fn test_plan_sync_case_insensitive() {
+        let targets = vec!["Tool".to_string(), "KORN".to_string(), "Meute".to_string()];
+        let current = vec![artist("tool", "UC1"), artist("Korn", "UC2")];
+
+        let plan = plan_sync(&targets, &current);
+        assert_eq!(plan.already_subscribed, vec!["Tool", "KORN"]);
+        assert_eq!(plan.to_subscribe, vec!["Meute"]);
+    }
+
+    #[test]
+    fn test_name_key_ignores_case() {
+        let keys: HashSet<NameKey> = ["Sigur Rós", "MUSE"].into_iter().map(NameKey).collect();
+        assert!(keys.contains(&NameKey("sigur rós")));
+        assert!(keys.contains(&NameKey("SIGUR RÓS")));
+        assert!(keys.contains(&NameKey("muse")));
+        assert!(!keys.contains(&NameKey("Muse Tribute")));
+    }
+
+    #[test]
+    fn test_plan_sync_skips_duplicate_targets() {
+        let targets = vec!["Muse".to_string(), "Tool".to_string(), "muse".to_string(), "TOOL".to_string()];
+        let current = vec![artist("Tool", "UC1")];
+
+        let plan = plan_sync(&targets, &current);
+        assert_eq!(plan.already_subscribed, vec!["Tool"]);
+        assert_eq!(plan.to_subscribe, vec!["Muse"]);
+    }
+
+    #[test]
+    fn test_plan_sync_no_current_subscriptions() {
+        let targets = vec!["Opiuo".to_string(), "Gramatik".to_string()];
+        let plan = plan_sync(&targets, &[]);
+        assert!(plan.already_subscribed.is_empty());
+        assert_eq!(plan.to_subscribe, vec!["Opiuo", "Gramatik"]);
+    }
+
+    #[test]
+    fn test_targets_fingerprint_ignores_order_case_and_repeats() {
+        let targets = vec!["Tool".to_string(), "Meute".to_string()];
+        let reordered = vec!["meute".to_string(), "TOOL".to_string(), "Tool".to_string()];
+        assert_eq!(targets_fingerprint(&targets), targets_fingerprint(&reordered));
+
+        let changed = vec!["Tool".to_string(), "Korn".to_string()];
+        assert_ne!(targets_fingerprint(&targets), targets_fingerprint(&changed));
+    }
+
+    #[test]
+    fn test_targets_fingerprint_is_stable() {
+        // Recorded fingerprints must match across builds: FNV-1a of "a"
+        assert_eq!(targets_fingerprint(&["A".to_string()]), 0xaf63_dc4c_8601_ec8c);
+    }
+
+    #[test]
+    fn test_sync_state_matches_recorded_targets() {
+        let path = std::env::temp_dir().join(format!("ytms_sync_state_{}.txt", std::process::id()));
+        let targets = vec!["Tool".to_string(), "Meute".to_string()];
+        record_sync_state(&path, &targets);
+
+        let same = sync_state_matches(&path, &targets, SYNC_STATE_MAX_AGE);
+        let other = sync_state_matches(&path, &["Korn".to_string()], SYNC_STATE_MAX_AGE);
+        std::fs::remove_file(&path).ok();
+
+        assert!(same);
+        assert!(!other);
+        assert!(!sync_state_matches(&path, &targets, SYNC_STATE_MAX_AGE));
+    }
+
+    #[test]
+    fn test_last_list_round_trip() {
+        let artists = vec![artist("Tool", "UC1"), artist("Meute", "UC2")];
+        let mut saved = Vec::new();
+        save_list_source(&mut saved, "config.json").unwrap();
+        save_artists(&mut saved, &artists).unwrap();
+
+        let path = std::env::temp_dir().join(format!("ytms_last_list_{}.jsonl", std::process::id()));
+        std::fs::write(&path, &saved).unwrap();
+        let loaded = load_last_list(&path, "config.json", LAST_LIST_MAX_AGE);
+        let other_source = load_last_list(&path, "artists.txt", LAST_LIST_MAX_AGE);
+        std::fs::remove_file(&path).ok();
+
+        let loaded = loaded.unwrap().expect("a fresh listing is used");
+        let ids: Vec<&str> = loaded.iter().map(|a| a.channel_id.as_str()).collect();
+        assert_eq!(ids, vec!["UC1", "UC2"]);
+        assert!(other_source.unwrap().is_none());
+    }
+
+    #[test]
+    fn test_load_last_list_missing_file() {
+        let path = std::env::temp_dir().join("ytms_missing_last_list.jsonl");
+        assert!(load_last_list(&path, "config.json", LAST_LIST_MAX_AGE).unwrap().is_none());
+    }
+
+    #[test]
+    fn test_load_last_list_empty_or_truncated_is_a_miss() {
+        let mut saved = Vec::new();
+        save_list_source(&mut saved, "config.json").unwrap();
+        let header_only = saved.clone();
+        save_artists(&mut saved, &[artist("Tool", "UC1")]).unwrap();
+        let truncated = &saved[..saved.len() - 5];
+
+        let path = std::env::temp_dir().join(format!("ytms_partial_last_list_{}.jsonl", std::process::id()));
+        let mut results = Vec::new();
+        for content in [&b""[..], &header_only, truncated] {
+            std::fs::write(&path, content).unwrap();
+            results.push(load_last_list(&path, "config.json", LAST_LIST_MAX_AGE).unwrap());
+        }
+        std::fs::remove_file(&path).ok();
+
+        assert!(results.iter().all(Option::is_none));
+    }
+
+    #[test]
+    fn test_write_sync_plan_dry_run() {
+        let plan = SyncPlan { already_subscribed: vec!["Tool"], to_subscribe: vec!["Meute"] };
+        let mut out = Vec::new();
+        write_sync_plan(&mut out, &plan, 5, 2, true).unwrap();
+
+        let text = String::from_utf8(out).unwrap();
+        assert!(text.contains("Already SUBSCRIBED to:"));
+        assert!(text.contains("Tool"));
+        assert!(text.contains("DRY RUN - Would SUBSCRIBE to:"));
+        assert!(text.contains("Meute"));
+    }
+
+    #[test]
+    fn test_write_sync_plan_nothing_to_subscribe() {
+        let plan = SyncPlan { already_subscribed: vec!["Tool"], to_subscribe: Vec::new() };
+        let mut out = Vec::new();
+        write_sync_plan(&mut out, &plan, 1, 1, false).unwrap();
+
+        let text = String::from_utf8(out).unwrap();
+        assert!(text.contains("All target artists are already subscribed!"));
+        assert!(!text.contains("DRY RUN"));
+    }
+
+    #[test]
+    fn test_sync_stats_processed() {
+        let stats = SyncStats { subscribed: 3, already_subscribed: 1, not_found: 2, failed: 1 };
+        assert_eq!(stats.processed(), 7);
+        assert_eq!(SyncStats::default().processed(), 0);
+    }
+
     #[test]
     fn test_format_subscriber_count() {
         assert_eq!(format_subscriber_count(500), "500");
@@ -558,5 +1210,7 @@ mod tests {
         assert_eq!(format_subscriber_count(150_000), "150K");
         assert_eq!(format_subscriber_count(1_500_000), "1.5M");
         assert_eq!(format_subscriber_count(15_000_000), "15.0M");
+        assert_eq!(format_subscriber_count(999_999), "1000K");
+        assert_eq!(format_subscriber_count(0), "0");
     }
 }
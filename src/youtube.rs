@@ -6,7 +6,12 @@ use log::{info, warn};
 use serde::{Deserialize, Serialize};
 use google_youtube3::yup_oauth2::{self as oauth2, InstalledFlowAuthenticator, InstalledFlowReturnMethod};
 use colored::*;
-use rusqlite::{Connection, params};
+use futures::StreamExt;
+use rusqlite::{Connection, OptionalExtension, params};
+use std::collections::HashMap;
+use std::path::{Path, PathBuf};
+use std::sync::atomic::{AtomicBool, Ordering};
+use std::sync::{Arc, Mutex, MutexGuard, OnceLock};
 // use chrono::{DateTime, Utc, Duration}; // For future cache expiry features
 
 #[derive(Debug, Clone, Serialize, Deserialize)]
@@ -17,6 +22,16 @@ pub struct Artist {
     pub description: Option<String>,
 }
 
+/// Channel ID prefix of the placeholder artists shown when nothing real could be fetched.
+const MOCK_CHANNEL_PREFIX: &str = "mock_id_";
+
+impl Artist {
+    /// Whether this is placeholder data rather than a real channel.
+    pub fn is_mock(&self) -> bool {
+        self.channel_id.starts_with(MOCK_CHANNEL_PREFIX)
+    }
+}
+
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct GoogleConfig {
     client_secret: serde_json::Value,
@@ -32,6 +47,15 @@ pub struct DatabaseConfig {
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct SettingsConfig {
     pub search_delay_ms: u64,
+    /// Maximum number of artist searches a sync runs at once
+    #[serde(default = "default_search_concurrency")]
+    pub search_concurrency: usize,
+    /// Maximum number of subscription requests a sync has in flight at once
+    #[serde(default = "default_subscribe_concurrency")]
+    pub subscribe_concurrency: usize,
+    /// Sustained limit on subscription requests per minute; 0 means no limit
+    #[serde(default = "default_subscribe_rate_per_minute")]
+    pub subscribe_rate_per_minute: u32,
     pub items_per_page: usize,
     pub request_timeout_seconds: u64,
     pub search_timeout_seconds: u64,
@@ -41,6 +65,18 @@ pub struct SettingsConfig {
     pub continue_on_subscription_failure: bool,
 }
 
+fn default_search_concurrency() -> usize {
+    4
+}
+
+fn default_subscribe_concurrency() -> usize {
+    4
+}
+
+fn default_subscribe_rate_per_minute() -> u32 {
+    60
+}
+
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct Config {
     pub google: GoogleConfig,
@@ -49,13 +85,250 @@ pub struct Config {
     pub settings: SettingsConfig,
 }
 
+/// The subset of a `search.list` response read by API key searches.
+/// Deserializing into these skips building a `serde_json::Value` tree for
+/// thumbnails and other fields that are never used.
+#[derive(Debug, Default, Deserialize)]
+struct ApiSearchResponse {
+    #[serde(default)]
+    items: Vec<ApiSearchItem>,
+}
+
+#[derive(Debug, Deserialize)]
+struct ApiSearchItem {
+    #[serde(default)]
+    id: ApiResourceId,
+    #[serde(default)]
+    snippet: ApiSnippet,
+}
+
+#[derive(Debug, Default, Deserialize)]
+#[serde(rename_all = "camelCase")]
+struct ApiResourceId {
+    channel_id: Option<String>,
+}
+
+#[derive(Debug, Default, Deserialize)]
+struct ApiSnippet {
+    title: Option<String>,
+    description: Option<String>,
+}
+
+/// The subset of a `channels.list` response read by API key lookups.
+#[derive(Debug, Default, Deserialize)]
+struct ApiChannelListResponse {
+    #[serde(default)]
+    items: Vec<ApiChannel>,
+}
+
+#[derive(Debug, Deserialize)]
+struct ApiChannel {
+    #[serde(default)]
+    id: String,
+    #[serde(default)]
+    snippet: ApiSnippet,
+    #[serde(default)]
+    statistics: ApiStatistics,
+}
+
+#[derive(Debug, Default, Deserialize)]
+#[serde(rename_all = "camelCase")]
+struct ApiStatistics {
+    subscriber_count: Option<String>,
+}
+
+/// The subset of an API error response read to tell a refused key from a bad request.
+#[derive(Debug, Default, Deserialize)]
+struct ApiErrorResponse {
+    #[serde(default)]
+    error: ApiError,
+}
+
+#[derive(Debug, Default, Deserialize)]
+struct ApiError {
+    #[serde(default)]
+    errors: Vec<ApiErrorItem>,
+}
+
+#[derive(Debug, Deserialize)]
+struct ApiErrorItem {
+    #[serde(default)]
+    reason: String,
+}
+
+/// Error reasons that mean the API key itself is unusable, rather than the request.
+const API_KEY_REFUSED_REASONS: [&str; 7] = [
+    "keyInvalid", "keyExpired", "accessNotConfigured", "forbidden",
+    "ipRefererBlocked", "quotaExceeded", "dailyLimitExceeded",
+];
+
+/// Whether an API error body says the key was refused, as opposed to a
+/// failure of this one request (e.g. a search term the API rejects).
+fn api_key_refused(body: &str) -> bool {
+    serde_json::from_str::<ApiErrorResponse>(body).is_ok_and(|response| {
+        response.error.errors.iter().any(|error| API_KEY_REFUSED_REASONS.contains(&error.reason.as_str()))
+    })
+}
+
+/// Failure categories for a subscription request, used to pick a retry policy
+/// and, through `SubscribeError`, how the caller reports the failure.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub enum SubscribeFailure {
+    RateLimited,
+    PermissionDenied,
+    ChannelNotFound,
+    Duplicate,
+    ServerError,
+    Other,
+}
+
+/// Error message markers for each failure category, checked in order.
+const SUBSCRIBE_FAILURE_MARKERS: [(&[&str], SubscribeFailure); 5] = [
+    (&["quotaExceeded", "rateLimitExceeded"], SubscribeFailure::RateLimited),
+    (&["forbidden", "403"], SubscribeFailure::PermissionDenied),
+    (&["channelNotFound", "404"], SubscribeFailure::ChannelNotFound),
+    (&["subscriptionDuplicate", "already subscribed"], SubscribeFailure::Duplicate),
+    (&["backend", "internal"], SubscribeFailure::ServerError),
+];
+
+impl SubscribeFailure {
+    fn classify(error_msg: &str) -> Self {
+        SUBSCRIBE_FAILURE_MARKERS
+            .iter()
+            .find(|(markers, _)| markers.iter().any(|marker| error_msg.contains(marker)))
+            .map(|(_, failure)| *failure)
+            .unwrap_or(SubscribeFailure::Other)
+    }
+}
+
+/// A failed subscription, carrying its category so callers can branch on
+/// `kind` (via `downcast_ref`) instead of matching the message text.
+#[derive(Debug)]
+pub struct SubscribeError {
+    pub kind: SubscribeFailure,
+    message: String,
+}
+
+impl SubscribeError {
+    fn new(kind: SubscribeFailure, message: impl Into<String>) -> anyhow::Error {
+        anyhow::Error::new(Self { kind, message: message.into() })
+    }
+}
+
+impl std::fmt::Display for SubscribeError {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.write_str(&self.message)
+    }
+}
+
+impl std::error::Error for SubscribeError {}
+
+/// Token bucket pacing requests to a sustained rate while letting up to
+/// `burst` go out back to back after a quiet spell. Tracked as the time the
+/// bucket is next empty (GCRA), so it needs no background refill.
+struct RateLimiter {
+    interval: std::time::Duration,
+    burst_tolerance: std::time::Duration,
+    next_free: Mutex<std::time::Instant>,
+}
+
+impl RateLimiter {
+    /// `None` when `per_minute` is zero, meaning requests are not limited.
+    fn new(per_minute: u32, burst: u32) -> Option<Self> {
+        if per_minute == 0 {
+            return None;
+        }
+        let interval = std::time::Duration::from_secs(60) / per_minute;
+        Some(Self {
+            interval,
+            burst_tolerance: interval * (burst.max(1) - 1),
+            next_free: Mutex::new(std::time::Instant::now()),
+        })
+    }
+
+    /// Takes a token as of `now`, returning how long to wait before using it.
+    fn reserve(&self, now: std::time::Instant) -> std::time::Duration {
+        let mut next_free = self.next_free.lock().unwrap_or_else(|poisoned| poisoned.into_inner());
+        let start = (*next_free).max(now);
+        *next_free = start + self.interval;
+        start.duration_since(now).saturating_sub(self.burst_tolerance)
+    }
+
+    async fn acquire(&self) {
+        let wait = self.reserve(std::time::Instant::now());
+        if !wait.is_zero() {
+            tokio::time::sleep(wait).await;
+        }
+    }
+}
+
+/// How one channel on a `list` page was resolved.
+enum PageEntry {
+    /// Fresh in the artist cache
+    Cached(Artist),
+    /// In the artist cache but expired; its details are refreshed by channel ID
+    Stale(Artist),
+    /// Looked up by search; `None` if the search timed out
+    Searched(Option<Result<Option<Artist>>>),
+}
+
+/// Which kind of `list` entry is waiting on the batched channel lookup;
+/// decides what is cached when that lookup comes back without it.
+#[derive(Clone, Copy, PartialEq)]
+enum Pending {
+    /// Fresh cache entry missing only its subscriber count
+    Cached,
+    /// Expired cache entry, searched again if its channel is not returned
+    Stale,
+    /// Just found by search
+    Searched,
+}
+
+/// Most channel IDs `channels.list` accepts in a single request.
+const CHANNELS_PER_REQUEST: usize = 50;
+
+/// Partial response selectors (`fields=`) naming only what the parsers read,
+/// so the API leaves thumbnails, etags and the like out of every response.
+const SEARCH_FIELDS: &str = "items(id/channelId,snippet(title,description,channelId))";
+const CHANNEL_FIELDS: &str = "items(id,snippet(title,description),statistics/subscriberCount)";
+const SUBSCRIPTION_FIELDS: &str = "nextPageToken,items/snippet(title,description,resourceId/channelId)";
+
+/// Suffixes tried after the plain artist name when a search finds no match.
+/// The "- Topic" forms catch YouTube's auto-generated music channels.
+const SEARCH_SUFFIXES: [&str; 8] = [
+    " band", " music", " official", " channel", "VEVO", " VEVO", " - Topic", "Topic",
+];
+
 pub struct YouTubeClient {
     youtube: YouTube<hyper_rustls::HttpsConnector<hyper_util::client::legacy::connect::HttpConnector>>,
+    /// HTTP client for API key requests, shared so its connection pool and
+    /// TLS sessions are reused across searches and channel lookups; built on
+    /// first use, so runs that never make one (e.g. dry-run sync) skip it
+    http: OnceLock<reqwest::Client>,
     config: Config,
+    /// Artist cache connection, opened once and shared by every lookup
+    cache_db: Mutex<Connection>,
+    /// SQLite datetime modifier for the cache expiry window, e.g. "-7 days"
+    cache_expiry: String,
+    /// Artists files already parsed during this run, keyed by path and kept
+    /// with the file's stamp at parse time; shared rather than copied out to
+    /// each page that reads them
+    artists_files: Mutex<HashMap<PathBuf, (FileStamp, Arc<[String]>)>>,
+    /// Search outcomes already seen during this run, keyed by lowercased
+    /// artist name, so repeated names don't go back to the network
+    searches: Mutex<HashMap<String, Option<Artist>>>,
+    /// Set once the API key is refused (invalid key or exhausted quota), after
+    /// which requests go straight to OAuth instead of failing on the key first
+    api_key_rejected: AtomicBool,
+    /// Paces subscription requests (retries included) across concurrent subscribes
+    subscribe_limiter: Option<RateLimiter>,
 }
 
 impl YouTubeClient {
     pub async fn new() -> Result<Self> {
+        // Initialize crypto provider for rustls (only commands that talk to the API pay for it)
+        let _ = rustls::crypto::ring::default_provider().install_default();
+
         let config = Self::load_config()?;
         Self::new_with_config(config).await
     }
@@ -68,28 +341,32 @@ impl YouTubeClient {
                 config_path
             ))?;
         
-        let config: Config = serde_json::from_str(&config_content)
-            .context("Failed to parse config.json. Please check the JSON format.")?;
-        
-        Ok(config)
+        Self::parse_config(&config_content)
+    }
+
+    /// Parses config.json content; kept apart from the file read so it can be exercised directly.
+    fn parse_config(config_content: &str) -> Result<Config> {
+        serde_json::from_str(config_content)
+            .context("Failed to parse config.json. Please check the JSON format.")
     }
     
     async fn new_with_config(config: Config) -> Result<Self> {
         info!("Initializing YouTube API client");
         info!("Note: Listing subscriptions requires OAuth authentication (API key not sufficient)");
         
+        // Open the artist cache on a blocking thread while authentication
+        // waits on the network; the two are independent
+        let cache_db_path = config.database.cache_db_path.clone();
+        let cache_db = tokio::task::spawn_blocking(move || Self::init_cache_db(&cache_db_path));
+        
         // Load client secret from config.json using oauth2 built-in parsing
-        let secret_json = serde_json::to_string(&config.google.client_secret)
+        let secret_json = serde_json::to_vec(&config.google.client_secret)
             .context("Failed to serialize client_secret from config")?;
         info!("Loading OAuth credentials from config.json");
         
-        // Write to temporary file and use oauth2::read_application_secret
-        let temp_path = "/tmp/temp_client_secret.json";
-        tokio::fs::write(temp_path, &secret_json).await
-            .context("Failed to write temporary credentials file")?;
-        let secret = oauth2::read_application_secret(temp_path).await
+        // Parse in memory rather than round-tripping through a temporary file
+        let secret = oauth2::parse_application_secret(&secret_json)
             .context("Failed to parse client_secret from config.json")?;
-        tokio::fs::remove_file(temp_path).await.ok(); // Clean up temp file
         
         info!("Using OAuth credentials from config.json");
 
@@ -98,21 +375,21 @@ impl YouTubeClient {
             "https://www.googleapis.com/auth/youtube"
         ];
         
+        // Build the TLS connector (root store and rustls config) once; the
+        // authenticator and the API hub each get a cheap clone of it
+        let https = HttpsConnectorBuilder::new()
+            .with_webpki_roots()
+            .https_or_http()
+            .enable_http1()
+            .enable_http2()
+            .build();
+        
         let auth = InstalledFlowAuthenticator::builder(
             secret,
             InstalledFlowReturnMethod::Interactive,
         )
         .persist_tokens_to_disk(&config.settings.token_cache_file)
-        .hyper_client(
-            Client::builder(TokioExecutor::new()).build(
-                HttpsConnectorBuilder::new()
-                    .with_webpki_roots()
-                    .https_or_http()
-                    .enable_http1()
-                    .enable_http2()
-                    .build()
-            )
-        )
+        .hyper_client(Client::builder(TokioExecutor::new()).build(https.clone()))
         .build()
         .await?;
 
@@ -147,13 +424,6 @@ impl YouTubeClient {
             }
         }
 
-        let https = HttpsConnectorBuilder::new()
-            .with_webpki_roots()
-            .https_or_http()
-            .enable_http1()
-            .enable_http2()
-            .build();
-
         let client = Client::builder(TokioExecutor::new())
             .build(https);
 
@@ -161,14 +431,27 @@ impl YouTubeClient {
         
         info!("API key available for public operations");
         
+        // Initialize database
+        let cache_db = cache_db.await.context("Artist cache initialization did not complete")??;
+        
+        let cache_expiry = format!("-{} days", config.database.cache_expiry_days);
+        let subscribe_limiter = RateLimiter::new(
+            config.settings.subscribe_rate_per_minute,
+            config.settings.subscribe_concurrency as u32,
+        );
+        
         let client = Self { 
             youtube,
+            http: OnceLock::new(),
             config,
+            cache_db: Mutex::new(cache_db),
+            cache_expiry,
+            artists_files: Mutex::new(HashMap::new()),
+            searches: Mutex::new(HashMap::new()),
+            api_key_rejected: AtomicBool::new(false),
+            subscribe_limiter,
         };
         
-        // Initialize database
-        client.init_cache_db()?;
-        
         Ok(client)
     }
     
@@ -176,8 +459,39 @@ impl YouTubeClient {
         &self.config.artists
     }
 
-    fn init_cache_db(&self) -> Result<()> {
-        let conn = Connection::open(&self.config.database.cache_db_path)?;
+    /// How many artist searches may run at once, never less than one.
+    pub fn search_concurrency(&self) -> usize {
+        self.config.settings.search_concurrency.max(1)
+    }
+
+    /// How many subscription requests may run at once, never less than one.
+    pub fn subscribe_concurrency(&self) -> usize {
+        self.config.settings.subscribe_concurrency.max(1)
+    }
+
+    /// Loads an artists file, parsing each path again only once the file's
+    /// modification time or size changes, so that paging through a list does
+    /// not re-read the file for every page yet still sees edits.
+    pub fn load_artists_file(&self, path: &Path) -> Result<Arc<[String]>> {
+        let mut artists_files = self.artists_files.lock()
+            .map_err(|_| anyhow::anyhow!("Artists file cache is unavailable after a previous failure"))?;
+        
+        let stamp = FileStamp::of(path);
+        if let (Some(stamp), Some((parsed_stamp, artists))) = (stamp, artists_files.get(path)) {
+            if stamp == *parsed_stamp {
+                return Ok(artists.clone());
+            }
+        }
+        
+        let artists: Arc<[String]> = load_artists_file(path)?.into();
+        if let Some(stamp) = stamp {
+            artists_files.insert(path.to_path_buf(), (stamp, Arc::clone(&artists)));
+        }
+        Ok(artists)
+    }
+
+    fn init_cache_db(cache_db_path: &str) -> Result<Connection> {
+        let conn = Connection::open(cache_db_path)?;
         
         conn.execute(
             "CREATE TABLE IF NOT EXISTS artist_cache (
@@ -191,22 +505,58 @@ impl YouTubeClient {
             [],
         )?;
         
-        info!("Initialized artist cache database: {}", self.config.database.cache_db_path);
-        Ok(())
+        info!("Initialized artist cache database: {cache_db_path}");
+        Ok(conn)
+    }
+
+    /// Keeps up to `search_concurrency` idle connections per host, so every
+    /// concurrent search finds a warm connection (HTTP/2 when the server
+    /// offers it), and bounds each request by `request_timeout_seconds`.
+    fn http(&self) -> &reqwest::Client {
+        self.http.get_or_init(|| {
+            let mut builder = reqwest::Client::builder()
+                .pool_max_idle_per_host(self.search_concurrency())
+                .user_agent(concat!("ytmusic-manager/", env!("CARGO_PKG_VERSION")));
+            if self.config.settings.request_timeout_seconds > 0 {
+                builder = builder.timeout(std::time::Duration::from_secs(self.config.settings.request_timeout_seconds));
+            }
+            builder.build().expect("Failed to initialize the HTTP client's TLS backend")
+        })
+    }
+
+    /// The API key for public requests, unless it is unset or already refused.
+    fn usable_api_key(&self) -> Option<&str> {
+        let api_key = self.config.google.api_key.as_str();
+        (!api_key.is_empty() && !self.api_key_rejected.load(Ordering::Relaxed)).then_some(api_key)
+    }
+
+    /// Stops using the API key for the rest of the run if the failed
+    /// `response` gives a key reason (see `API_KEY_REFUSED_REASONS`); any
+    /// other failure only affects the request that got it.
+    async fn check_api_key_refusal(&self, response: reqwest::Response) {
+        let status = response.status();
+        let body = response.text().await.unwrap_or_default();
+        if api_key_refused(&body) && !self.api_key_rejected.swap(true, Ordering::Relaxed) {
+            warn!("API key refused ({status}), using OAuth for the rest of this run");
+        }
+    }
+
+    fn cache_conn(&self) -> Result<MutexGuard<'_, Connection>> {
+        self.cache_db.lock()
+            .map_err(|_| anyhow::anyhow!("Artist cache connection is unavailable after a previous failure"))
     }
 
     fn get_cached_artist(&self, search_name: &str) -> Result<Option<Artist>> {
-        let conn = Connection::open(&self.config.database.cache_db_path)?;
+        let conn = self.cache_conn()?;
         
         // Check if we have recent cached data
-        let cache_days = format!("-{} days", self.config.database.cache_expiry_days);
-        let mut stmt = conn.prepare(
+        let mut stmt = conn.prepare_cached(
             "SELECT name, channel_id, subscriber_count, description 
              FROM artist_cache 
              WHERE search_name = ? AND cached_at > datetime('now', ?)"
         )?;
         
-        let mut rows = stmt.query_map(params![search_name, cache_days], |row| {
+        let mut rows = stmt.query_map(params![search_name, self.cache_expiry], |row| {
             Ok(Artist {
                 name: row.get(0)?,
                 channel_id: row.get(1)?,
@@ -223,134 +573,230 @@ impl YouTubeClient {
         Ok(None)
     }
 
+    /// The artist last cached for `search_name`, whether or not the entry has
+    /// expired; its channel ID is still valid for refreshing the details.
+    fn get_stale_cached_artist(&self, search_name: &str) -> Result<Option<Artist>> {
+        let conn = self.cache_conn()?;
+        
+        let artist = conn.prepare_cached(
+            "SELECT name, channel_id, subscriber_count, description 
+             FROM artist_cache 
+             WHERE search_name = ?"
+        )?.query_row(params![search_name], |row| {
+            Ok(Artist {
+                name: row.get(0)?,
+                channel_id: row.get(1)?,
+                subscriber_count: row.get(2)?,
+                description: row.get(3)?,
+            })
+        }).optional()?;
+        
+        Ok(artist)
+    }
+
     fn cache_artist(&self, search_name: &str, artist: &Artist) -> Result<()> {
-        let conn = Connection::open(&self.config.database.cache_db_path)?;
+        let conn = self.cache_conn()?;
         
-        conn.execute(
+        conn.prepare_cached(
             "INSERT OR REPLACE INTO artist_cache 
              (search_name, name, channel_id, subscriber_count, description, cached_at)
-             VALUES (?, ?, ?, ?, ?, datetime('now'))",
-            params![
-                search_name,
-                artist.name,
-                artist.channel_id,
-                artist.subscriber_count,
-                artist.description
-            ],
-        )?;
+             VALUES (?, ?, ?, ?, ?, datetime('now'))"
+        )?.execute(params![
+            search_name,
+            artist.name,
+            artist.channel_id,
+            artist.subscriber_count,
+            artist.description
+        ])?;
         
         info!("Cached artist data for: {search_name}");
         Ok(())
     }
 
-    pub async fn get_my_subscriptions(&self) -> Result<Vec<Artist>> {
+    /// The account's subscriptions, and whether they were listed from the
+    /// account itself (`false` when resolved from the known channels instead).
+    pub async fn get_my_subscriptions(&self) -> Result<(Vec<Artist>, bool)> {
         info!("Fetching user subscriptions");
         
-        // Try to get subscription list (this might fail due to OAuth scope limitations)
+        // Ask the API for the account's own subscriptions first
         info!("Attempting to fetch subscriptions via YouTube API...");
+        match self.list_my_subscriptions().await {
+            Ok(artists) => {
+                info!("Fetched {} subscriptions via YouTube API", artists.len());
+                Ok((artists, true))
+            }
+            Err(e) => {
+                // Fall back to resolving the known channels one by one
+                warn!("Could not list subscriptions via YouTube API: {e}");
+                info!("Fetching real details for known subscription channels");
+                let (artists, _, _) = self.get_subscriptions_with_pagination(0, 1000, None, false, false).await?;
+                Ok((artists, false))
+            }
+        }
+    }
+
+    /// Lists the account's subscriptions with `subscriptions.list(mine=true)`,
+    /// 50 per page (the API maximum): one request per page of subscriptions
+    /// instead of a search and a channel lookup per artist.
+    async fn list_my_subscriptions(&self) -> Result<Vec<Artist>> {
+        let mut artists = Vec::new();
+        let mut page_token: Option<String> = None;
         
-        // For now, we'll use known channels since we know the OAuth2 library has scope constraints
-        // In the future, this could be enhanced to work with proper API permissions
-        info!("Fetching real details for known subscription channels");
-        // This function is now only used by sync - return all results
-        // Use config artists by default
-        let (artists, _, _) = self.get_subscriptions_with_pagination(0, 1000, None, false, false).await?;
-        return Ok(artists);
+        loop {
+            let mut req = self.youtube.subscriptions()
+                .list(&vec!["snippet".to_string()])
+                .mine(true)
+                .max_results(50)
+                .param("fields", SUBSCRIPTION_FIELDS);
+            if let Some(token) = &page_token {
+                req = req.page_token(token);
+            }
+            
+            let (_, response) = req.doit().await
+                .context("Failed to list subscriptions")?;
+            
+            artists.extend(response.items.unwrap_or_default().into_iter().filter_map(|subscription| {
+                let snippet = subscription.snippet?;
+                let channel_id = snippet.resource_id?.channel_id?;
+                Some(Artist {
+                    name: snippet.title.unwrap_or_default(),
+                    channel_id,
+                    subscriber_count: None,
+                    description: snippet.description,
+                })
+            }));
+            
+            match response.next_page_token {
+                Some(token) => page_token = Some(token),
+                None => break,
+            }
+        }
+        
+        Ok(artists)
     }
 
-    async fn get_channel_details(&self, channel_id: &str) -> Result<Artist> {
-        // Try API key approach first (more quota-friendly)
-        let api_key = &self.config.google.api_key;
-        if !api_key.is_empty() {
-            let client = reqwest::Client::new();
-            let url = format!(
-                "https://www.googleapis.com/youtube/v3/channels?part=snippet,statistics&id={channel_id}&key={api_key}"
+    /// Fetches details for many channels, keyed by channel ID, sending up to
+    /// `CHANNELS_PER_REQUEST` IDs per `channels.list` call rather than one call
+    /// per channel. Channels the API does not return are absent from the map.
+    async fn get_channels_details(&self, channel_ids: &[&str]) -> Result<HashMap<String, Artist>> {
+        let mut details = HashMap::with_capacity(channel_ids.len());
+        for chunk in channel_ids.chunks(CHANNELS_PER_REQUEST) {
+            details.extend(
+                self.get_channel_details_batch(chunk).await?
+                    .into_iter()
+                    .map(|artist| (artist.channel_id.clone(), artist))
             );
+        }
+        Ok(details)
+    }
+
+    async fn get_channel_details_batch(&self, channel_ids: &[&str]) -> Result<Vec<Artist>> {
+        let ids = channel_ids.join(",");
+        
+        // Try API key approach first (more quota-friendly)
+        if let Some(api_key) = self.usable_api_key() {
+            let request = self.http()
+                .get("https://www.googleapis.com/youtube/v3/channels")
+                .query(&[
+                    ("part", "snippet,statistics"),
+                    ("id", ids.as_str()),
+                    ("fields", CHANNEL_FIELDS),
+                    ("key", api_key),
+                ]);
             
-            if let Ok(response) = client.get(&url).send().await {
-                if let Ok(data) = response.json::<serde_json::Value>().await {
-                    if let Some(items) = data["items"].as_array() {
-                        if let Some(item) = items.first() {
-                            let name = item["snippet"]["title"].as_str().unwrap_or("Unknown").to_string();
-                            let description = item["snippet"]["description"].as_str().map(|s| s.to_string());
-                            let subscriber_count = item["statistics"]["subscriberCount"].as_str()
-                                .and_then(|s| s.parse::<u64>().ok());
-                            
-                            return Ok(Artist {
-                                name,
-                                channel_id: channel_id.to_string(),
-                                subscriber_count,
-                                description,
-                            });
-                        }
+            if let Ok(response) = request.send().await {
+                if !response.status().is_success() {
+                    self.check_api_key_refusal(response).await;
+                } else if let Ok(data) = response.json::<ApiChannelListResponse>().await {
+                    if !data.items.is_empty() {
+                        return Ok(data.items.into_iter().map(|item| Artist {
+                            name: item.snippet.title.unwrap_or_else(|| "Unknown".to_string()),
+                            channel_id: item.id,
+                            subscriber_count: item.statistics.subscriber_count
+                                .and_then(|s| s.parse::<u64>().ok()),
+                            description: item.snippet.description,
+                        }).collect());
                     }
                 }
             }
         }
         
         // Fallback to OAuth approach
-        let req = self.youtube.channels()
+        let mut req = self.youtube.channels()
             .list(&vec!["snippet".to_string(), "statistics".to_string()])
-            .add_id(channel_id);
-            
-        let response = req.doit().await?;
-        let (_, channel_response) = response;
-        
-        if let Some(items) = channel_response.items {
-            if let Some(channel) = items.first() {
-                if let Some(snippet) = &channel.snippet {
-                    let name = snippet.title.as_ref().unwrap_or(&"Unknown".to_string()).clone();
-                    let description = snippet.description.clone();
-                    let subscriber_count = channel.statistics.as_ref()
-                        .and_then(|s| s.subscriber_count);
-                    
-                    return Ok(Artist {
-                        name,
-                        channel_id: channel_id.to_string(),
-                        subscriber_count,
-                        description,
-                    });
+            .param("fields", CHANNEL_FIELDS);
+        for channel_id in channel_ids {
+            req = req.add_id(channel_id);
+        }
+        
+        let (_, channel_response) = req.doit().await
+            .with_context(|| format!("Failed to get channel details for {ids}"))?;
+        
+        Ok(channel_response.items.unwrap_or_default().into_iter().filter_map(|channel| {
+            let channel_id = channel.id?;
+            let snippet = channel.snippet?;
+            Some(Artist {
+                name: snippet.title.unwrap_or_else(|| "Unknown".to_string()),
+                channel_id,
+                subscriber_count: channel.statistics.and_then(|s| s.subscriber_count),
+                description: snippet.description,
+            })
+        }).collect())
+    }
+
+    /// A list page entry answered from the artist cache, or `None` if the
+    /// channel has never been resolved and needs a search.
+    fn cached_page_entry(&self, channel_name: &str, force_update: bool) -> Option<PageEntry> {
+        // Check cache first (unless force_update is true)
+        if !force_update {
+            match self.get_cached_artist(channel_name) {
+                Ok(Some(cached_artist)) => {
+                    info!("Using cached data for: {channel_name}");
+                    return Some(PageEntry::Cached(cached_artist));
+                }
+                Ok(None) => {
+                    info!("No cache for {channel_name}, searching API...");
+                }
+                Err(e) => {
+                    warn!("Cache error for {channel_name}: {e}");
                 }
             }
+        } else {
+            info!("Force update enabled, bypassing cache for: {channel_name}");
         }
         
-        anyhow::bail!("Failed to get channel details for {channel_id}")
+        // A channel resolved on an earlier run is refreshed by ID with the
+        // batched channels.list lookup instead of running the search again
+        let stale_artist = self.get_stale_cached_artist(channel_name).ok().flatten()?;
+        info!("Refreshing {channel_name} by channel ID {}", stale_artist.channel_id);
+        Some(PageEntry::Stale(stale_artist))
     }
 
     pub async fn get_subscriptions_with_pagination(&self, offset: usize, limit: usize, artists_file: Option<&std::path::Path>, force_update: bool, verbose: bool) -> Result<(Vec<Artist>, bool, usize)> {
-        // Get the channels to fetch - either from file or config
-        let all_channels = if let Some(file_path) = artists_file {
+        // Get the channels to fetch - either from file or config, borrowed
+        // so each page only touches its own slice of the list
+        let file_channels;
+        let all_channels: &[String] = if let Some(file_path) = artists_file {
             // Use provided artists file
-            let artists_content = match std::fs::read_to_string(file_path) {
-                Ok(content) => content,
-                Err(_) => {
-                    warn!("Could not read artists file: {}, using mock data", file_path.display());
-                    let mock_subs = self.get_mock_subscriptions().await?;
-                    let len = mock_subs.len();
-                    return Ok((mock_subs, false, len));
-                }
-            };
-            
-            match parse_artists_file(&artists_content) {
+            file_channels = match self.load_artists_file(file_path) {
                 Ok(artists) => artists,
-                Err(_) => {
-                    warn!("Could not parse artists file, using mock data");
+                Err(e) => {
+                    warn!("Could not load artists file: {e}, using mock data");
                     let mock_subs = self.get_mock_subscriptions().await?;
                     let len = mock_subs.len();
                     return Ok((mock_subs, false, len));
                 }
-            }
+            };
+            &file_channels
         } else {
             // Use config artists
-            self.config.artists.clone()
+            &self.config.artists
         };
         
         // Apply pagination
         let total_channels = all_channels.len();
-        let page_channels: Vec<String> = all_channels.into_iter()
-            .skip(offset)
-            .take(limit)
-            .collect();
+        let page_start = offset.min(total_channels);
+        let page_channels = &all_channels[page_start..page_start.saturating_add(limit).min(total_channels)];
         
         if page_channels.is_empty() {
             return Ok((Vec::new(), false, total_channels)); // No more results
@@ -359,7 +805,6 @@ impl YouTubeClient {
         let has_more = offset + page_channels.len() < total_channels;
         let mut artists = Vec::new();
         
-        use colored::*;
         if verbose {
             println!("{}", format!("Fetching details for {page_channels_len} channels (page {page_num} of approx {total_pages})...", 
                      page_channels_len = page_channels.len(), 
@@ -371,99 +816,149 @@ impl YouTubeClient {
               (offset / limit) + 1,
               (total_channels + limit - 1) / limit);
         
-        for (i, channel_name) in page_channels.iter().enumerate() {
+        let search_timeout = std::time::Duration::from_secs(self.config.settings.search_timeout_seconds);
+        let search_delay = std::time::Duration::from_millis(self.config.settings.search_delay_ms);
+        // Channels the cache can't answer are searched concurrently, with
+        // search starts spaced `search_delay` apart; buffered() hands the
+        // results back in page order
+        let start = tokio::time::Instant::now();
+        let mut slots = 0u32..;
+        let lookups = page_channels.iter().map(|channel_name| {
+            info!("Processing channel: {channel_name}");
+            let cached = self.cached_page_entry(channel_name, force_update);
+            let slot = if cached.is_none() { slots.next() } else { None };
+            async move {
+                let entry = match (cached, slot) {
+                    (Some(entry), _) => entry,
+                    (None, slot) => {
+                        tokio::time::sleep_until(start + search_delay * slot.unwrap_or_default()).await;
+                        let timed_search = tokio::time::timeout(
+                            search_timeout,
+                            self.search_artist_with_verbose(channel_name, false)
+                        ).await;
+                        PageEntry::Searched(timed_search.ok())
+                    }
+                };
+                (channel_name, entry)
+            }
+        });
+        let mut lookups = futures::stream::iter(lookups).buffered(self.search_concurrency());
+        
+        // Channels whose subscriber counts still need fetching, as indices into
+        // `artists`; looked up together after the loop in batched requests
+        let mut needs_details: Vec<(usize, &str, Pending)> = Vec::new();
+        let mut done = 0;
+        while let Some((channel_name, entry)) = lookups.next().await {
+            done += 1;
             if verbose {
-                print!("{}", format!("  [{current}/{total}] {channel_name}...", current = i + 1, total = page_channels.len(), channel_name = channel_name).bright_black());
-                std::io::Write::flush(&mut std::io::stdout()).unwrap();
+                print!("{}", format!("  [{current}/{total}] {channel_name}...", current = done, total = page_channels.len(), channel_name = channel_name).bright_black());
             }
-            info!("Processing channel: {channel_name}");
             
-            // Check cache first (unless force_update is true)
-            if !force_update {
-                match self.get_cached_artist(channel_name) {
-                    Ok(Some(cached_artist)) => {
-                        if verbose {
-                            println!(" cached ✓");
-                        }
-                        info!("Using cached data for: {channel_name}");
-                        artists.push(cached_artist);
-                        continue;
+            match entry {
+                PageEntry::Cached(cached_artist) => {
+                    if verbose {
+                        println!(" cached ✓");
                     }
-                    Ok(None) => {
-                        info!("No cache for {channel_name}, searching API...");
+                    // Entries cached by sync come straight from search,
+                    // without a subscriber count; fill it in with the batch
+                    if cached_artist.subscriber_count.is_none() {
+                        needs_details.push((artists.len(), channel_name.as_str(), Pending::Cached));
                     }
-                    Err(e) => {
-                        warn!("Cache error for {channel_name}: {e}");
+                    artists.push(cached_artist);
+                }
+                PageEntry::Stale(stale_artist) => {
+                    if verbose {
+                        println!(" refreshing ✓");
                     }
+                    needs_details.push((artists.len(), channel_name.as_str(), Pending::Stale));
+                    artists.push(stale_artist);
                 }
-            } else {
-                info!("Force update enabled, bypassing cache for: {channel_name}");
-            }
-            
-            // Search for the channel to get its ID with timeout
-            let search_timeout = tokio::time::timeout(
-                std::time::Duration::from_secs(self.config.settings.search_timeout_seconds),
-                self.search_artist_with_verbose(channel_name, verbose)
-            ).await;
-
-            match search_timeout {
-                Ok(search_result) => match search_result {
-                    Ok(Some(artist)) => {
-                        // Now get full details including subscriber count
-                        match self.get_channel_details(&artist.channel_id).await {
-                            Ok(detailed_artist) => {
-                                if verbose {
-                                    println!(" found ✓");
-                                }
-                                info!("Got details for {}: {} subs", detailed_artist.name, 
-                                    detailed_artist.subscriber_count.map(|c| c.to_string()).unwrap_or("N/A".to_string()));
-                                
-                                // Cache the detailed artist data
-                                if let Err(e) = self.cache_artist(channel_name, &detailed_artist) {
-                                    warn!("Failed to cache {channel_name}: {e}");
-                                }
-                                
-                                artists.push(detailed_artist);
-                            },
-                            Err(e) => {
-                                if verbose {
-                                    println!(" partial ⚠");
-                                }
-                                info!("Failed to get details for {channel_name}: {e}");
-                                
-                                // Cache basic info so we don't search again
-                                if let Err(cache_err) = self.cache_artist(channel_name, &artist) {
-                                    warn!("Failed to cache basic info for {channel_name}: {cache_err}");
-                                }
-                                
-                                artists.push(artist); // Use basic info
-                            }
-                        }
-                    },
-                    Ok(None) => {
-                        if verbose {
-                            println!(" not found ✗");
-                        }
-                        info!("Could not find channel: {channel_name}");
-                    },
-                    Err(e) => {
-                        if verbose {
-                            println!(" error ✗");
-                        }
-                        info!("Search failed for {channel_name}: {e}");
+                PageEntry::Searched(Some(Ok(Some(artist)))) => {
+                    if verbose {
+                        println!(" found ✓");
+                    }
+                    // Full details including subscriber count are fetched after the loop
+                    needs_details.push((artists.len(), channel_name.as_str(), Pending::Searched));
+                    artists.push(artist);
+                }
+                PageEntry::Searched(Some(Ok(None))) => {
+                    if verbose {
+                        println!(" not found ✗");
+                    }
+                    info!("Could not find channel: {channel_name}");
+                }
+                PageEntry::Searched(Some(Err(e))) => {
+                    if verbose {
+                        println!(" error ✗");
                     }
-                },
-                Err(_) => {
+                    info!("Search failed for {channel_name}: {e}");
+                }
+                PageEntry::Searched(None) => {
                     if verbose {
-                        use colored::*;
                         println!(" {}", "too long ⏱".bright_red());
                     }
                     info!("Search timeout for {channel_name} (> {} seconds)", self.config.settings.search_timeout_seconds);
                 }
             }
+        }
+
+        if !needs_details.is_empty() {
+            let channel_ids: Vec<&str> = needs_details.iter()
+                .map(|&(index, _, _)| artists[index].channel_id.as_str())
+                .collect();
             
-            // Add delay between requests to be respectful
-            tokio::time::sleep(std::time::Duration::from_millis(self.config.settings.search_delay_ms)).await;
+            let details = match self.get_channels_details(&channel_ids).await {
+                Ok(details) => details,
+                Err(e) => {
+                    if verbose {
+                        println!("  {}", "channel details unavailable, showing basic info ⚠".bright_yellow());
+                    }
+                    info!("Failed to get channel details: {e}");
+                    HashMap::new()
+                }
+            };
+            
+            // Only what was actually looked up is (re)cached: a details miss
+            // must not re-stamp an older entry as fresh
+            let mut missing_stale = Vec::new();
+            for &(index, channel_name, pending) in &needs_details {
+                match details.get(&artists[index].channel_id) {
+                    Some(detailed_artist) => {
+                        info!("Got details for {}: {} subs", detailed_artist.name,
+                            detailed_artist.subscriber_count.map(|c| c.to_string()).unwrap_or("N/A".to_string()));
+                        artists[index] = detailed_artist.clone();
+                    }
+                    None => {
+                        info!("No details returned for {channel_name}, keeping basic info");
+                        match pending {
+                            // Already cached as it is; leave its timestamp alone
+                            Pending::Cached => continue,
+                            // The channel may be gone; search for it again below
+                            Pending::Stale => {
+                                missing_stale.push((index, channel_name));
+                                continue;
+                            }
+                            // Fresh from search, so basic info is worth keeping
+                            Pending::Searched => {}
+                        }
+                    }
+                }
+                if let Err(e) = self.cache_artist(channel_name, &artists[index]) {
+                    warn!("Failed to cache {channel_name}: {e}");
+                }
+            }
+            
+            // Expired entries whose channel lookup came back empty fall back to
+            // a search, which caches whatever it finds
+            for (index, channel_name) in missing_stale {
+                tokio::time::sleep(search_delay).await;
+                match tokio::time::timeout(search_timeout, self.search_artist(channel_name)).await {
+                    Ok(Ok(Some(artist))) => artists[index] = artist,
+                    Ok(Ok(None)) => info!("Could not find channel: {channel_name}"),
+                    Ok(Err(e)) => info!("Search failed for {channel_name}: {e}"),
+                    Err(_) => info!("Search timeout for {channel_name} (> {} seconds)", self.config.settings.search_timeout_seconds),
+                }
+            }
         }
         
         if artists.is_empty() {
@@ -481,13 +976,13 @@ impl YouTubeClient {
         let mock_subscriptions = vec![
             Artist {
                 name: "Let's Get Rusty".to_string(),
-                channel_id: "mock_id_1".to_string(),
+                channel_id: format!("{MOCK_CHANNEL_PREFIX}1"),
                 subscriber_count: None,
                 description: Some("Rust programming tutorials (mock data)".to_string()),
             },
             Artist {
                 name: "Marques Brownlee".to_string(),
-                channel_id: "mock_id_2".to_string(),
+                channel_id: format!("{MOCK_CHANNEL_PREFIX}2"),
                 subscriber_count: None,
                 description: Some("Technology reviews (mock data)".to_string()),
             },
@@ -497,44 +992,77 @@ impl YouTubeClient {
         Ok(mock_subscriptions)
     }
 
-    fn generate_search_variations(&self, artist_name: &str) -> Vec<String> {
-        let mut variations = vec![artist_name.to_string()];
+    fn generate_search_variations(artist_name: &str) -> Vec<String> {
+        let single_word = !artist_name.contains(' ');
+        let mut variations = Vec::with_capacity(1 + SEARCH_SUFFIXES.len() + if single_word { 2 } else { 0 });
+        variations.push(artist_name.to_string());
         
         // Add common variations
-        variations.push(format!("{} band", artist_name));
-        variations.push(format!("{} music", artist_name));
-        variations.push(format!("{} official", artist_name));
-        variations.push(format!("{} channel", artist_name));
-        variations.push(format!("{}VEVO", artist_name));
-        variations.push(format!("{} VEVO", artist_name));
-        
-        // Add "- Topic" variation (common for music channels)
-        variations.push(format!("{} - Topic", artist_name));
-        variations.push(format!("{}Topic", artist_name));
+        variations.extend(SEARCH_SUFFIXES.iter().map(|suffix| format!("{artist_name}{suffix}")));
         
         // For single word artists, try some alternatives
-        if !artist_name.contains(' ') {
-            variations.push(format!("{}band", artist_name));
-            variations.push(format!("The {}", artist_name));
+        if single_word {
+            variations.push(format!("{artist_name}band"));
+            variations.push(format!("The {artist_name}"));
         }
         
         variations
     }
 
+    /// The artist cached for `artist_name` by an earlier run, if still fresh.
+    pub fn cached_artist(&self, artist_name: &str) -> Option<Artist> {
+        self.get_cached_artist(artist_name).unwrap_or_else(|e| {
+            warn!("Cache error for {artist_name}: {e}");
+            None
+        })
+    }
+
+    /// Searches for an artist's channel and caches what it finds, so later
+    /// runs can answer from `cached_artist` instead.
     pub async fn search_artist(&self, artist_name: &str) -> Result<Option<Artist>> {
-        self.search_artist_with_verbose(artist_name, false).await
+        let found = self.search_artist_with_verbose(artist_name, false).await?;
+        if let Some(artist) = &found {
+            if let Err(e) = self.cache_artist(artist_name, artist) {
+                warn!("Failed to cache {artist_name}: {e}");
+            }
+        }
+        Ok(found)
     }
 
     pub async fn search_artist_with_verbose(&self, artist_name: &str, verbose: bool) -> Result<Option<Artist>> {
+        let key = artist_name.to_lowercase();
+        let earlier = self.searches.lock().ok().and_then(|searches| searches.get(&key).cloned());
+        if let Some(found) = earlier {
+            info!("Using earlier search result for: {artist_name}");
+            return Ok(found);
+        }
+        
+        let found = self.search_artist_variations(artist_name, verbose).await?;
+        if let Ok(mut searches) = self.searches.lock() {
+            searches.insert(key, found.clone());
+        }
+        Ok(found)
+    }
+
+    async fn search_artist_variations(&self, artist_name: &str, verbose: bool) -> Result<Option<Artist>> {
         info!("Searching for artist: {artist_name}");
         
-        let search_variations = self.generate_search_variations(artist_name);
+        let search_variations = Self::generate_search_variations(artist_name);
+        let search_delay = std::time::Duration::from_millis(self.config.settings.search_delay_ms);
+        let mut last_start = tokio::time::Instant::now();
         
         for (attempt, search_term) in search_variations.iter().enumerate() {
+            // Small delay between retries to be respectful, measured from the
+            // previous request's start so a slow response already counts
+            // towards it instead of being followed by the full delay
+            if attempt > 1 {
+                tokio::time::sleep_until(last_start + search_delay).await;
+            }
+            last_start = tokio::time::Instant::now();
+            
             if attempt > 0 {
                 info!("Retry #{attempt} with search term: {search_term}");
                 if verbose {
-                    use colored::*;
                     print!(" retry #{attempt}...", attempt = attempt.to_string().bright_yellow());
                     std::io::Write::flush(&mut std::io::stdout()).unwrap();
                 }
@@ -551,11 +1079,6 @@ impl YouTubeClient {
                 }
                 return Ok(result);
             }
-            
-            // Small delay between retries to be respectful
-            if attempt > 0 && attempt < search_variations.len() - 1 {
-                tokio::time::sleep(std::time::Duration::from_millis(200)).await;
-            }
         }
         
         warn!("No matching artist found after trying {} variations", search_variations.len());
@@ -564,25 +1087,29 @@ impl YouTubeClient {
 
     async fn try_search_with_term(&self, search_term: &str, original_name: &str) -> Result<Option<Artist>> {
         // Try using API key for search operations
-        let api_key = &self.config.google.api_key;
-        if !api_key.is_empty() {
-            let client = reqwest::Client::new();
-            let url = format!(
-                "https://www.googleapis.com/youtube/v3/search?part=snippet&q={}&type=channel&maxResults=10&key={}",
-                urlencoding::encode(search_term),
-                api_key
-            );
-
-            let response = client.get(&url).send().await
+        if let Some(api_key) = self.usable_api_key() {
+            // query() percent-encodes every value, not just the search term
+            let response = self.http()
+                .get("https://www.googleapis.com/youtube/v3/search")
+                .query(&[
+                    ("part", "snippet"),
+                    ("q", search_term),
+                    ("type", "channel"),
+                    ("maxResults", "10"),
+                    ("fields", SEARCH_FIELDS),
+                    ("key", api_key),
+                ])
+                .send().await
                 .context("Failed to make API request")?;
             
             if response.status().is_success() {
-                let search_result: serde_json::Value = response.json().await
+                let search_result: ApiSearchResponse = response.json().await
                     .context("Failed to parse API response")?;
                 
                 return self.parse_api_search_results(search_result, original_name);
             } else {
                 info!("API key search failed with status: {}", response.status());
+                self.check_api_key_refusal(response).await;
                 // Fall through to OAuth approach
             }
         }
@@ -591,32 +1118,32 @@ impl YouTubeClient {
         let req = self.youtube.search().list(&vec!["snippet".to_string()])
             .q(search_term)
             .param("type", "channel")
+            .param("fields", SEARCH_FIELDS)
             .max_results(10);
 
         let response = req.doit().await
-            .context(format!("Failed to search for artist '{search_term}'. This might indicate: 1) YouTube Data API v3 is not enabled, 2) Missing search permissions, or 3) API quota exceeded"))?;
+            .with_context(|| format!("Failed to search for artist '{search_term}'. This might indicate: 1) YouTube Data API v3 is not enabled, 2) Missing search permissions, or 3) API quota exceeded"))?;
 
         let (_, search_response) = response;
         self.parse_search_results(search_response, original_name)
     }
 
     fn parse_search_results(&self, search_response: google_youtube3::api::SearchListResponse, artist_name: &str) -> Result<Option<Artist>> {
+        // Lowercase the searched name once rather than for every result
+        let artist_lower = artist_name.to_lowercase();
         if let Some(items) = search_response.items {
             for item in items {
                 if let Some(snippet) = item.snippet {
-                    if let Some(title) = &snippet.title {
-                        // Simple matching - look for exact or close match
-                        if title.to_lowercase() == artist_name.to_lowercase() ||
-                           title.to_lowercase().contains(&artist_name.to_lowercase()) ||
-                           artist_name.to_lowercase().contains(&title.to_lowercase()) {
-                            
-                            let channel_id = item.id.as_ref()
-                                .and_then(|id| id.channel_id.as_ref())
-                                .unwrap_or(&snippet.channel_id.unwrap_or_default())
-                                .clone();
+                    // Results without a channel ID are skipped rather than
+                    // matched with an empty ID that could never be subscribed to
+                    let channel_id = item.id
+                        .and_then(|id| id.channel_id)
+                        .or(snippet.channel_id);
+                    if let (Some(title), Some(channel_id)) = (snippet.title, channel_id) {
+                        if titles_match(&title, &artist_lower) {
 
                             let artist = Artist {
-                                name: title.clone(),
+                                name: title,
                                 channel_id,
                                 subscriber_count: None,
                                 description: snippet.description,
@@ -634,28 +1161,22 @@ impl YouTubeClient {
         Ok(None)
     }
 
-    fn parse_api_search_results(&self, search_result: serde_json::Value, artist_name: &str) -> Result<Option<Artist>> {
-        if let Some(items) = search_result["items"].as_array() {
-            for item in items {
-                if let (Some(title), Some(channel_id)) = (
-                    item["snippet"]["title"].as_str(),
-                    item["id"]["channelId"].as_str()
-                ) {
-                    // Simple matching - look for exact or close match
-                    if title.to_lowercase() == artist_name.to_lowercase() ||
-                       title.to_lowercase().contains(&artist_name.to_lowercase()) ||
-                       artist_name.to_lowercase().contains(&title.to_lowercase()) {
-                        
-                        let artist = Artist {
-                            name: title.to_string(),
-                            channel_id: channel_id.to_string(),
-                            subscriber_count: None,
-                            description: item["snippet"]["description"].as_str().map(|s| s.to_string()),
-                        };
-
-                        info!("Found matching artist: {}", artist.name);
-                        return Ok(Some(artist));
-                    }
+    fn parse_api_search_results(&self, search_result: ApiSearchResponse, artist_name: &str) -> Result<Option<Artist>> {
+        // Lowercase the searched name once rather than for every result
+        let artist_lower = artist_name.to_lowercase();
+        for item in search_result.items {
+            if let (Some(title), Some(channel_id)) = (item.snippet.title, item.id.channel_id) {
+                if titles_match(&title, &artist_lower) {
+                    
+                    let artist = Artist {
+                        name: title,
+                        channel_id,
+                        subscriber_count: None,
+                        description: item.snippet.description,
+                    };
+
+                    info!("Found matching artist: {}", artist.name);
+                    return Ok(Some(artist));
                 }
             }
         }
@@ -684,6 +1205,9 @@ impl YouTubeClient {
         };
 
         for attempt in 0..max_retries {
+            if let Some(limiter) = &self.subscribe_limiter {
+                limiter.acquire().await;
+            }
             let req = self.youtube.subscriptions().insert(subscription.clone())
                 .add_part("snippet");
 
@@ -698,33 +1222,40 @@ impl YouTubeClient {
                     
                     // Check for specific error types
                     let error_msg = format!("{e}");
-                    if error_msg.contains("quotaExceeded") || error_msg.contains("rateLimitExceeded") {
-                        if attempt < max_retries - 1 {
-                            let delay = 2_u64.pow(attempt) * 1000; // Exponential backoff
-                            warn!("API quota/rate limit hit, retrying in {delay}ms");
-                            tokio::time::sleep(std::time::Duration::from_millis(delay)).await;
-                            continue;
-                        } else {
-                            anyhow::bail!("API quota exceeded after {} retries. Please wait and try again later, or request quota increase in Google Cloud Console", max_retries)
+                    match SubscribeFailure::classify(&error_msg) {
+                        SubscribeFailure::RateLimited => {
+                            if attempt < max_retries - 1 {
+                                let delay = (2_u64.pow(attempt) * 1000).min(30_000); // Exponential backoff, capped at 30s
+                                warn!("API quota/rate limit hit, retrying in {delay}ms");
+                                tokio::time::sleep(std::time::Duration::from_millis(delay)).await;
+                                continue;
+                            } else {
+                                return Err(SubscribeError::new(SubscribeFailure::RateLimited, format!("API quota exceeded after {max_retries} retries. Please wait and try again later, or request quota increase in Google Cloud Console")));
+                            }
+                        }
+                        SubscribeFailure::PermissionDenied => {
+                            return Err(SubscribeError::new(SubscribeFailure::PermissionDenied, "Permission denied. Check OAuth consent screen settings and ensure your account is added as a test user"));
+                        }
+                        SubscribeFailure::ChannelNotFound => {
+                            return Err(SubscribeError::new(SubscribeFailure::ChannelNotFound, "Channel not found or no longer available"));
+                        }
+                        SubscribeFailure::Duplicate => {
+                            info!("Already subscribed to channel: {channel_id}");
+                            return Ok(()); // Treat duplicate as success
+                        }
+                        SubscribeFailure::ServerError => {
+                            if attempt < max_retries - 1 {
+                                let delay = 1000 + (attempt as u64 * 500); // Linear backoff for server errors
+                                warn!("Server error, retrying in {delay}ms");
+                                tokio::time::sleep(std::time::Duration::from_millis(delay)).await;
+                                continue;
+                            } else {
+                                return Err(SubscribeError::new(SubscribeFailure::ServerError, format!("Server error after {max_retries} retries: {e}")));
+                            }
                         }
-                    } else if error_msg.contains("forbidden") || error_msg.contains("403") {
-                        anyhow::bail!("Permission denied. Check OAuth consent screen settings and ensure your account is added as a test user")
-                    } else if error_msg.contains("channelNotFound") || error_msg.contains("404") {
-                        anyhow::bail!("Channel not found or no longer available")
-                    } else if error_msg.contains("subscriptionDuplicate") || error_msg.contains("already subscribed") {
-                        info!("Already subscribed to channel: {channel_id}");
-                        return Ok(()); // Treat duplicate as success
-                    } else if error_msg.contains("backend") || error_msg.contains("internal") {
-                        if attempt < max_retries - 1 {
-                            let delay = 1000 + (attempt as u64 * 500); // Linear backoff for server errors
-                            warn!("Server error, retrying in {delay}ms");
-                            tokio::time::sleep(std::time::Duration::from_millis(delay)).await;
-                            continue;
-                        } else {
-                            anyhow::bail!("Server error after {} retries: {e}", max_retries)
+                        SubscribeFailure::Other => {
+                            return Err(SubscribeError::new(SubscribeFailure::Other, format!("Subscription failed: {e}")));
                         }
-                    } else {
-                        anyhow::bail!("Subscription failed: {e}")
                     }
                 }
             }
@@ -747,41 +1278,120 @@ impl YouTubeClient {
     }
 }
 
-pub fn parse_artists_file(content: &str) -> Result<Vec<String>> {
-    let mut artists = Vec::new();
-    
-    for (line_num, line) in content.lines().enumerate() {
-        let line = line.trim();
-        if line.is_empty() || line.starts_with('#') {
-            continue;
+/// Simple matching - an exact or close match between a result title and the
+/// already lowercased searched name, lowercasing the title only once.
+fn titles_match(title: &str, artist_lower: &str) -> bool {
+    let title_lower = title.to_lowercase();
+    title_lower.contains(artist_lower) || artist_lower.contains(&title_lower)
+}
+
+/// A file's modification time and size, which change whenever it is rewritten.
+#[derive(Debug, Clone, Copy, PartialEq)]
+struct FileStamp {
+    modified: Option<std::time::SystemTime>,
+    len: u64,
+}
+
+impl FileStamp {
+    /// `None` if the file cannot be stat-ed, so nothing is remembered for it.
+    fn of(path: &Path) -> Option<Self> {
+        let metadata = std::fs::metadata(path).ok()?;
+        Some(Self { modified: metadata.modified().ok(), len: metadata.len() })
+    }
+}
+
+/// Reads an artists file with a single bulk read and parses it into artist names.
+pub fn load_artists_file(path: &std::path::Path) -> Result<Vec<String>> {
+    // Read directly and map NotFound, rather than stat-ing first with exists()
+    let content = match std::fs::read_to_string(path) {
+        Ok(content) => content,
+        Err(e) if e.kind() == std::io::ErrorKind::NotFound => {
+            anyhow::bail!("Artists file not found: {}", path.display())
+        }
+        Err(e) => {
+            return Err(e).with_context(|| format!("Failed to read artists file: {}", path.display()));
         }
+    };
+    parse_artists_file(&content)
+}
+
+pub fn parse_artists_file(content: &str) -> Result<Vec<String>> {
+    artist_entries(content)
+        .map(|entry| entry.map(|entry| entry.name.to_string()))
+        .collect()
+}
+
+/// Yields the 1-based line number and trimmed text of each entry line,
+/// skipping blank lines and `#` comments in a single filter.
+fn entry_lines(content: &str) -> impl Iterator<Item = (usize, &str)> {
+    content
+        .lines()
+        .enumerate()
+        .map(|(i, line)| (i + 1, line.trim()))
+        .filter(|(_, line)| !line.is_empty() && !line.starts_with('#'))
+}
+
+/// Splits an entry line into its trimmed artist name and, if a `|` is
+/// present, the trimmed tag text after it. Lines come from `entry_lines`
+/// already trimmed, so a line without tags is returned as is.
+fn split_entry(line: &str) -> (&str, Option<&str>) {
+    match line.split_once('|') {
+        Some((name, tags)) => (name.trim(), Some(tags.trim())),
+        None => (line, None),
+    }
+}
+
+/// One artist entry of an artists file, borrowed from the file content.
+#[derive(Debug, PartialEq)]
+pub struct ArtistEntry<'a> {
+    pub line_num: usize,
+    pub name: &'a str,
+    pub tags: Option<&'a str>,
+}
 
+/// Parses an artists file into entries borrowed from `content`, so callers
+/// that only inspect the entries (such as validation) never allocate per line
+/// and get line numbers and tags from the same pass.
+pub fn parse_artist_entries(content: &str) -> Result<Vec<ArtistEntry<'_>>> {
+    artist_entries(content).collect()
+}
+
+/// Each artist entry, in order, as one lazy pipeline that both parsers
+/// collect; empty names are warned about and skipped, and an over-long name
+/// yields an error that stops the collect.
+fn artist_entries(content: &str) -> impl Iterator<Item = Result<ArtistEntry<'_>>> {
+    entry_lines(content).filter_map(|(line_num, line)| {
         // Parse artist name (before any | tags)
-        let artist_name = if let Some(pipe_pos) = line.find('|') {
-            line[..pipe_pos].trim().to_string()
-        } else {
-            line.to_string()
-        };
+        let (artist_name, tags) = split_entry(line);
 
         if artist_name.is_empty() {
-            warn!("Empty artist name on line {}", line_num + 1);
-            continue;
+            warn!("Empty artist name on line {line_num}");
+            return None;
         }
 
         if artist_name.len() > 100 {
-            anyhow::bail!("Artist name too long on line {}: {}", line_num + 1, artist_name);
+            return Some(Err(anyhow::anyhow!("Artist name too long on line {line_num}: {artist_name}")));
         }
 
-        artists.push(artist_name);
-    }
-
-    Ok(artists)
+        Some(Ok(ArtistEntry { line_num, name: artist_name, tags }))
+    })
 }
 
 #[cfg(test)]
 mod tests {
     use super::*;
 
+    #[test]
+    fn test_api_key_refused_only_for_key_reasons() {
+        let refused = r#"{"error":{"code":400,"errors":[{"reason":"keyInvalid","domain":"usageLimits"}]}}"#;
+        let quota = r#"{"error":{"code":403,"errors":[{"reason":"quotaExceeded"}]}}"#;
+        let bad_request = r#"{"error":{"code":400,"errors":[{"reason":"invalidParameter"}]}}"#;
+        assert!(api_key_refused(refused));
+        assert!(api_key_refused(quota));
+        assert!(!api_key_refused(bad_request));
+        assert!(!api_key_refused("not json"));
+    }
+
     #[test]
     fn test_parse_artists_file_basic() {
         let content = "Artist One\nArtist Two\n# Comment line\nArtist Three";
@@ -818,6 +1428,110 @@ mod tests {
         assert!(result.is_err());
     }
 
+    #[test]
+    fn test_split_entry() {
+        assert_eq!(split_entry("Tool"), ("Tool", None));
+        assert_eq!(split_entry("Muse | rock, alt "), ("Muse", Some("rock, alt")));
+        assert_eq!(split_entry("Korn|"), ("Korn", Some("")));
+    }
+
+    #[test]
+    fn test_parse_artist_entries_keeps_line_numbers_and_tags() {
+        let content = "# Artists\nTool\n\nMuse | rock\n";
+        let entries = parse_artist_entries(content).unwrap();
+        assert_eq!(entries, vec![
+            ArtistEntry { line_num: 2, name: "Tool", tags: None },
+            ArtistEntry { line_num: 4, name: "Muse", tags: Some("rock") },
+        ]);
+    }
+
+    #[test]
+    fn test_parse_example_config() {
+        let config = YouTubeClient::parse_config(include_str!("../config.example.json")).unwrap();
+        assert_eq!(config.database.cache_expiry_days, 7);
+        assert_eq!(config.settings.items_per_page, 50);
+        assert_eq!(config.settings.search_concurrency, 4);
+        assert_eq!(config.settings.subscribe_concurrency, 4);
+        assert_eq!(config.settings.subscribe_rate_per_minute, 60);
+        assert!(config.artists.contains(&"Nine Inch Nails".to_string()));
+        assert!(config.google.client_secret.get("installed").is_some());
+    }
+
+    #[test]
+    fn test_search_concurrency_defaults_when_absent() {
+        let content = include_str!("../config.example.json")
+            .replace("\"search_concurrency\": 4,", "")
+            .replace("\"subscribe_concurrency\": 4,", "")
+            .replace("\"subscribe_rate_per_minute\": 60,", "");
+        let config = YouTubeClient::parse_config(&content).unwrap();
+        assert_eq!(config.settings.search_concurrency, default_search_concurrency());
+        assert_eq!(config.settings.subscribe_concurrency, default_subscribe_concurrency());
+        assert_eq!(config.settings.subscribe_rate_per_minute, default_subscribe_rate_per_minute());
+    }
+
+    #[test]
+    fn test_parse_config_rejects_invalid_json() {
+        assert!(YouTubeClient::parse_config("{ \"google\": ").is_err());
+    }
+
+    #[test]
+    fn test_entry_lines_skips_blank_and_comments() {
+        let content = "# header\n\n  Radiohead  \n   # indented comment\nMuse | rock\n";
+        let lines: Vec<_> = entry_lines(content).collect();
+        assert_eq!(lines, vec![(3, "Radiohead"), (5, "Muse | rock")]);
+    }
+
+    #[test]
+    fn test_parse_artists_file_large_list() {
+        // Build the whole fixture in one buffer, as a real catalog file would be read
+        let content = (0..1000)
+            .map(|i| format!("Artist {i} | tag{i}"))
+            .collect::<Vec<_>>()
+            .join("\n");
+        let result = parse_artists_file(&content).unwrap();
+        assert_eq!(result.len(), 1000);
+        assert_eq!(result[0], "Artist 0");
+        assert_eq!(result[999], "Artist 999");
+    }
+
+    #[test]
+    fn test_load_artists_file_from_disk() {
+        let path = std::env::temp_dir().join(format!("ytms_artists_{}.txt", std::process::id()));
+        std::fs::write(&path, "Artist 1\nArtist 2|rock\n# Comment\n").unwrap();
+        let result = load_artists_file(&path);
+        std::fs::remove_file(&path).ok();
+        assert_eq!(result.unwrap(), vec!["Artist 1", "Artist 2"]);
+    }
+
+    #[test]
+    fn test_titles_match() {
+        assert!(titles_match("Tool", "tool"));
+        assert!(titles_match("Tool - Topic", "tool"));
+        assert!(titles_match("Muse", "muse official"));
+        assert!(!titles_match("Korn", "tool"));
+    }
+
+    #[test]
+    fn test_file_stamp_changes_when_file_is_rewritten() {
+        let path = std::env::temp_dir().join(format!("ytms_stamp_{}.txt", std::process::id()));
+        std::fs::write(&path, "Artist 1\n").unwrap();
+        let before = FileStamp::of(&path);
+        std::fs::write(&path, "Artist 1\nArtist 2\n").unwrap();
+        let after = FileStamp::of(&path);
+        std::fs::remove_file(&path).ok();
+
+        assert!(before.is_some());
+        assert_ne!(before, after);
+        assert_eq!(FileStamp::of(&path), None);
+    }
+
+    #[test]
+    fn test_load_artists_file_not_found() {
+        let path = std::env::temp_dir().join("ytms_missing_artists_file.txt");
+        let err = load_artists_file(&path).unwrap_err();
+        assert!(err.to_string().starts_with("Artists file not found"));
+    }
+
     #[test]
     fn test_artist_creation() {
         let artist = Artist {
@@ -848,47 +1562,83 @@ mod tests {
         assert_eq!(artist.description, None);
     }
 
-    fn generate_search_variations_for_test(artist_name: &str) -> Vec<String> {
-        let mut variations = vec![artist_name.to_string()];
-        
-        // Add common variations
-        variations.push(format!("{} band", artist_name));
-        variations.push(format!("{} music", artist_name));
-        variations.push(format!("{} official", artist_name));
-        variations.push(format!("{} channel", artist_name));
-        variations.push(format!("{}VEVO", artist_name));
-        variations.push(format!("{} VEVO", artist_name));
-        
-        // Add "- Topic" variation (common for music channels)
-        variations.push(format!("{} - Topic", artist_name));
-        variations.push(format!("{}Topic", artist_name));
-        
-        // For single word artists, try some alternatives
-        if !artist_name.contains(' ') {
-            variations.push(format!("{}band", artist_name));
-            variations.push(format!("The {}", artist_name));
-        }
-        
-        variations
-    }
-
     #[test]
     fn test_generate_search_variations() {
         // Test single word artist
-        let variations = generate_search_variations_for_test("Tool");
+        let variations = YouTubeClient::generate_search_variations("Tool");
         assert!(variations.contains(&"Tool".to_string()));
         assert!(variations.contains(&"Tool band".to_string()));
         assert!(variations.contains(&"Tool - Topic".to_string()));
         assert!(variations.contains(&"The Tool".to_string()));
         
         // Test multi-word artist
-        let variations = generate_search_variations_for_test("Nine Inch Nails");
+        let variations = YouTubeClient::generate_search_variations("Nine Inch Nails");
         assert!(variations.contains(&"Nine Inch Nails".to_string()));
         assert!(variations.contains(&"Nine Inch Nails band".to_string()));
         assert!(variations.contains(&"Nine Inch Nails - Topic".to_string()));
         assert!(!variations.contains(&"The Nine Inch Nails".to_string())); // Only for single words
     }
 
+    #[test]
+    fn test_api_search_response_parsing() {
+        let json = r#"{
+            "kind": "youtube#searchListResponse",
+            "items": [
+                {"id": {"kind": "youtube#channel", "channelId": "UC123"},
+                 "snippet": {"title": "Tool", "description": "Official channel", "thumbnails": {}}},
+                {"id": {"kind": "youtube#channel"}, "snippet": {"title": "No Id"}}
+            ]
+        }"#;
+        let response: ApiSearchResponse = serde_json::from_str(json).unwrap();
+        assert_eq!(response.items.len(), 2);
+        assert_eq!(response.items[0].id.channel_id.as_deref(), Some("UC123"));
+        assert_eq!(response.items[0].snippet.title.as_deref(), Some("Tool"));
+        assert_eq!(response.items[1].id.channel_id, None);
+
+        let empty: ApiSearchResponse = serde_json::from_str(r#"{"error": {"code": 403}}"#).unwrap();
+        assert!(empty.items.is_empty());
+    }
+
+    #[test]
+    fn test_api_channel_response_parsing() {
+        let json = r#"{"items": [{"id": "UC1", "snippet": {"title": "Tool"}, "statistics": {"subscriberCount": "1500", "videoCount": "10"}}]}"#;
+        let response: ApiChannelListResponse = serde_json::from_str(json).unwrap();
+        assert_eq!(response.items[0].id, "UC1");
+        assert_eq!(response.items[0].statistics.subscriber_count.as_deref(), Some("1500"));
+        assert_eq!(response.items[0].snippet.description, None);
+    }
+
+    #[test]
+    fn test_subscribe_error_downcast() {
+        let err = SubscribeError::new(SubscribeFailure::PermissionDenied, "Permission denied");
+        assert_eq!(err.to_string(), "Permission denied");
+        assert_eq!(err.downcast_ref::<SubscribeError>().map(|e| e.kind), Some(SubscribeFailure::PermissionDenied));
+    }
+
+    #[test]
+    fn test_rate_limiter_allows_burst_then_paces() {
+        let limiter = RateLimiter::new(60, 3).unwrap();
+        let now = std::time::Instant::now();
+        let waits: Vec<u64> = (0..5).map(|_| limiter.reserve(now).as_secs()).collect();
+        assert_eq!(waits, vec![0, 0, 0, 1, 2]);
+
+        // After a quiet spell the full burst is available again
+        let later = now + std::time::Duration::from_secs(60);
+        assert_eq!(limiter.reserve(later), std::time::Duration::ZERO);
+
+        assert!(RateLimiter::new(0, 3).is_none());
+    }
+
+    #[test]
+    fn test_subscribe_failure_classify() {
+        assert_eq!(SubscribeFailure::classify("quotaExceeded: daily limit"), SubscribeFailure::RateLimited);
+        assert_eq!(SubscribeFailure::classify("HTTP 403 forbidden"), SubscribeFailure::PermissionDenied);
+        assert_eq!(SubscribeFailure::classify("channelNotFound"), SubscribeFailure::ChannelNotFound);
+        assert_eq!(SubscribeFailure::classify("subscriptionDuplicate"), SubscribeFailure::Duplicate);
+        assert_eq!(SubscribeFailure::classify("backendError"), SubscribeFailure::ServerError);
+        assert_eq!(SubscribeFailure::classify("connection reset"), SubscribeFailure::Other);
+    }
+
     // Note: We can't easily test the full search functionality without mocking HTTP requests,
     // but the variation generation logic is tested above.
 }
\ No newline at end of file